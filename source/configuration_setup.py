@@ -1,10 +1,284 @@
-import os  # TODO: Is entire module needed?
-import sys  # TODO: Is entire module needed?
-from configparser import ConfigParser
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from stat import S_ISDIR, S_ISREG
+
+# Parameters read from the configuration file, given as (attribute, section, key, type).
+# The type decides how the value is converted, see _SETTING_CONVERTERS.
+
+# Parameters that are always read
+GENERAL_SETTINGS = (
+    ("compiler", "Turbospectrum_compiler", "compiler", "lowercase"),
+    ("path_turbospectrum", "Paths", "turbospectrum", "path"),
+    ("path_interpolator", "Paths", "interpolator", "path"),
+    ("path_linelists", "Paths", "linelists", "path"),
+    ("path_model_atmospheres", "Paths", "model_atmospheres", "path"),
+    ("path_output_directory", "Paths", "output_directory", "path"),
+    ("wavelength_min", "Atmosphere_parameters", "wavelength_min", "float"),
+    ("wavelength_max", "Atmosphere_parameters", "wavelength_max", "float"),
+    ("wavelength_step", "Atmosphere_parameters", "wavelength_step", "float"),
+    (
+        "read_stellar_parameters_from_file",
+        "Stellar_parameters",
+        "read_from_file",
+        "bool",
+    ),
+    ("xit", "Turbospectrum_settings", "xit", "float"),
+)
+
+# Parameters only read if the stellar parameters are generated
+STELLAR_PARAMETER_SETTINGS = (
+    ("random_parameters", "Stellar_parameters", "random_parameters", "bool"),
+    ("teff_min", "Stellar_parameters", "teff_min", "int"),
+    ("teff_max", "Stellar_parameters", "teff_max", "int"),
+    ("logg_min", "Stellar_parameters", "logg_min", "float"),
+    ("logg_max", "Stellar_parameters", "logg_max", "float"),
+    ("z_min", "Stellar_parameters", "z_min", "float"),
+    ("z_max", "Stellar_parameters", "z_max", "float"),
+    ("mg_min", "Stellar_parameters", "mg_min", "float"),
+    ("mg_max", "Stellar_parameters", "mg_max", "float"),
+    ("ca_min", "Stellar_parameters", "ca_min", "float"),
+    ("ca_max", "Stellar_parameters", "ca_max", "float"),
+)
+
+# Parameters only read if random stellar parameters are generated
+RANDOM_SETTINGS = (("num_spectra", "Random_settings", "num_spectra", "int"),)
+
+# Parameters that may be left out of the configuration file if random stellar parameters are generated
+OPTIONAL_RANDOM_SETTINGS = (("seed", "Random_settings", "seed", "int"),)
+
+# Parameters only read if evenly spaced stellar parameters are generated
+EVEN_SETTINGS = (
+    ("num_points_teff", "Even_settings", "num_points_teff", "int"),
+    ("num_points_logg", "Even_settings", "num_points_logg", "int"),
+    ("num_points_z", "Even_settings", "num_points_z", "int"),
+    ("num_points_mg", "Even_settings", "num_points_mg", "int"),
+    ("num_points_ca", "Even_settings", "num_points_ca", "int"),
+)
+
+# Parameters only read if the stellar parameters are read from a file
+INPUT_FILE_SETTINGS = (("path_input_parameters", "Paths", "input_parameters", "path"),)
+
+# Patterns matching a section header and a "key = value" line in the configuration file,
+# compiled once when the module is imported
+_SECTION_PATTERN = re.compile(r"\[([^\]]+)\]$")
+_KEY_VALUE_PATTERN = re.compile(r"([^=:]+?)\s*[=:]\s*(.*)$")
+
+# Strings accepted as boolean values in the configuration file
+_BOOLEAN_STATES = {
+    "1": True,
+    "yes": True,
+    "true": True,
+    "on": True,
+    "0": False,
+    "no": False,
+    "false": False,
+    "off": False,
+}
+
+# Functions used to convert a value of each type from the string in the configuration file.
+# Paths are kept as written, since relative paths are resolved against the working directory
+# each time a Configuration is created, see _PATH_ATTRIBUTES
+_SETTING_CONVERTERS = {
+    "lowercase": str.lower,
+    "path": str,
+    "int": int,
+    "float": float,
+    "bool": lambda value: _BOOLEAN_STATES[value.lower()],
+}
+
+# Attributes holding paths, which are made absolute when they are set on a Configuration
+_PATH_ATTRIBUTES = frozenset(
+    attribute
+    for settings in (
+        GENERAL_SETTINGS,
+        STELLAR_PARAMETER_SETTINGS,
+        RANDOM_SETTINGS,
+        OPTIONAL_RANDOM_SETTINGS,
+        EVEN_SETTINGS,
+        INPUT_FILE_SETTINGS,
+    )
+    for attribute, _, _, value_type in settings
+    if value_type == "path"
+)
+
+# Names of the stellar parameters used in error messages, and whether their values must be non-negative
+# TODO: Change the lower limit of the surface gravity to 2
+# TODO: Don't raise error for the surface gravity, print warning and let the program continuer.
+STELLAR_PARAMETER_RANGES = {
+    "teff": ("effective temperature", True),
+    "logg": ("surface gravity", True),
+    "z": ("metallicity", False),
+    "mg": ("magnesium abundance", False),
+    "ca": ("calcium abundance", False),
+}
+
+# Directories in the Turbospectrum directory containing the executables built by each supported compiler
+COMPILED_DIRECTORIES = {"intel": "exec", "gfortran": "exec-gf"}
+
+# Parameters parsed from configuration files, keyed by the path, modification time
+# and size of the file, so that unchanged files are only parsed once
+_PARSED_CONFIGURATION_FILES = {}
+
+# Configuration files whose values have passed validation, keyed in the same way as the parsed files
+_VALIDATED_CONFIGURATION_FILES = set()
+
+
+def _file_key(path):
+    """
+    Get a key identifying the current version of a file.
+
+    Args:
+        path (str): The path to the file.
+    Returns:
+        tuple: The path, modification time and size of the file.
+    """
+    file_stat = os.stat(path)
+    return (path, file_stat.st_mtime_ns, file_stat.st_size)
+
+
+def _parse_configuration_text(text: str):
+    """
+    Parse the contents of a configuration file.
+
+    The configuration file only contains sections with "key = value" lines and comments,
+    so it is parsed directly instead of with configparser. As in configparser, keys are
+    case-insensitive, both "=" and ":" separate keys from values, lines starting
+    with "#" or ";" are comments, and a section or a key within a section can only
+    be given once.
+    Args:
+        text (str): The contents of the configuration file.
+    Returns:
+        dict: A dictionary with a dictionary of keys and values for each section.
+    Raises:
+        ValueError: If a line is neither a section header, a "key = value" line nor a comment,
+        or if a section or a key within a section is repeated.
+    """
+    sections = {}
+    current_section = None
+    for line in text.splitlines():
+        line = line.strip()
+
+        # Skip empty lines and comments
+        if not line or line[0] in "#;":
+            continue
+
+        section_match = _SECTION_PATTERN.match(line)
+        if section_match:
+            section = section_match.group(1).strip()
+            if section in sections:
+                raise ValueError(
+                    f"The section [{section}] is repeated in the configuration file."
+                )
+            current_section = sections[section] = {}
+            continue
+
+        key_value_match = _KEY_VALUE_PATTERN.match(line)
+        if current_section is None or not key_value_match:
+            raise ValueError(f"Invalid line in the configuration file: {line}")
+
+        key, value = key_value_match.groups()
+        key = key.lower()
+        if key in current_section:
+            raise ValueError(
+                f"The parameter {key} is repeated in section [{section}] of the configuration file."
+            )
+        current_section[key] = value
+
+    return sections
+
+
+def _read_settings(sections: dict, settings: tuple, optional: bool = False):
+    """
+    Read a group of parameters from the configuration file.
+
+    Args:
+        sections (dict): The contents of the configuration file, as a dictionary with
+        a dictionary of keys and values for each section.
+        settings (tuple): The parameters to read, given as (attribute, section, key, type).
+        optional (bool, optional): If True, parameters missing from the configuration file are left out
+        of the returned values, so the attributes keep their default values. Defaults to False.
+    Returns:
+        dict: The values of the parameters, with the names of the attributes as keys.
+    Raises:
+        ValueError: If a required parameter is missing or a parameter has a value that can't be converted to its type.
+    """
+    values = {}
+    for attribute, section, key, value_type in settings:
+        if optional and key not in sections.get(section, {}):
+            continue
+        try:
+            values[attribute] = _SETTING_CONVERTERS[value_type](sections[section][key])
+        except KeyError:
+            raise ValueError(
+                f"The parameter {key} in section [{section}] of the configuration file is missing or invalid."
+            ) from None
+    return values
+
+
+def _require_path(path, is_directory, error_message):
+    """
+    Check that a path exists and is a directory or a regular file.
+
+    The check is done with a single stat call, instead of first checking that
+    the path exists and then what type of file it is.
+    Args:
+        path (str): The path to check.
+        is_directory (bool): True if the path should be a directory, False if it should be a regular file.
+        error_message (str): The message of the error raised if the check fails.
+    Raises:
+        FileNotFoundError: If the path does not exist, can't be accessed or is not of the expected type.
+    """
+    # Any error from stat, e.g. a path running through a file or a directory without
+    # permission, is reported in the same way as a missing path
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        raise FileNotFoundError(error_message) from None
+
+    if not (S_ISDIR(mode) if is_directory else S_ISREG(mode)):
+        raise FileNotFoundError(error_message)
 
 
 class Configuration:
 
+    # The attributes are fixed, so they are stored in slots instead of a per-instance dictionary
+    __slots__ = (
+        "config_file",
+        "_config_file_key",
+        "compiler",
+        "path_turbospectrum",
+        "path_interpolator",
+        "path_linelists",
+        "path_model_atmospheres",
+        "path_input_parameters",
+        "path_output_directory",
+        "path_config",
+        "wavelength_min",
+        "wavelength_max",
+        "wavelength_step",
+        "read_stellar_parameters_from_file",
+        "random_parameters",
+        "teff_min",
+        "teff_max",
+        "logg_min",
+        "logg_max",
+        "z_min",
+        "z_max",
+        "mg_min",
+        "mg_max",
+        "ca_min",
+        "ca_max",
+        "num_spectra",
+        "seed",
+        "num_points_teff",
+        "num_points_logg",
+        "num_points_z",
+        "num_points_mg",
+        "num_points_ca",
+        "xit",
+    )
+
     def __init__(self, config_path="input/configuration.cfg"):
         """
         Initialize the configuration object.
@@ -13,17 +287,22 @@ class Configuration:
             self (Configuration): The configuration object.
             config_path (str, optional): The path to the configuration file to use. Defaults to "input/configuration.cfg".
         Raises:
-            FileNotFoundError: If the configuration file does not exist.
+            FileNotFoundError: If the configuration file or any of the configured paths do not exist.
+            ValueError: If any of the configuration parameters are missing or invalid.
         """
         self.config_file = os.path.abspath(config_path)
-        if not os.path.exists(self.config_file):
+
+        # A single stat both checks that the file exists and identifies the version of the file
+        # used to look up the cached parameters and validation result
+        try:
+            self._config_file_key = _file_key(self.config_file)
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"The config file {self.config_file} does not exist."
-            )
+            ) from None
 
         self.compiler = None
         self.path_turbospectrum = None
-        self.path_turbospectrum_compiled = None
         self.path_interpolator = None
         self.path_linelists = None
         self.path_model_atmospheres = None
@@ -49,6 +328,7 @@ class Configuration:
         self.ca_max = 0
 
         self.num_spectra = 0
+        self.seed = None
         self.num_points_teff = 0
         self.num_points_logg = 0
         self.num_points_z = 0
@@ -58,106 +338,69 @@ class Configuration:
         self.xit = 0
 
         self._load_configuration_file()
-        try:
-            self._validate_configuration()
-        except (FileNotFoundError, ValueError) as e:
-            print(e)
-            sys.exit(1)
+        self._validate_configuration()
 
     def _load_configuration_file(self):
         """
         Load the configuration file and set the configuration parameters.
 
-        Parameters in the configuration file must be explicity set in this function,
-        meaning that additions to the configuration file will not be recognised by
-        the program unless they are loaded by this function.
+        The parsed parameters are cached, keyed by the path, modification time and size of the file,
+        so the file is only parsed again if it has been changed since it was last loaded.
+        Paths are cached as written in the file, and made absolute here, so that relative paths
+        are resolved against the current working directory.
         Args:
             self (Configuration): The configuration object.
 
         Side effects: Sets the configuration parameters based on the configuration file.
         """
-        # Read configuration file
-        config_parser = ConfigParser()
-        config_parser.read(self.config_file)
-
-        # Set configuration parameters found in the configuration file
-        self.compiler = config_parser.get("Turbospectrum_compiler", "compiler").lower()
+        settings = _PARSED_CONFIGURATION_FILES.get(self._config_file_key)
+        if settings is None:
+            settings = self._read_configuration_file()
+            _PARSED_CONFIGURATION_FILES[self._config_file_key] = settings
 
-        self.path_turbospectrum = os.path.abspath(
-            config_parser.get("Paths", "turbospectrum")
-        )
-        self.path_interpolator = os.path.abspath(
-            config_parser.get("Paths", "interpolator")
-        )
-        self.path_linelists = os.path.abspath(config_parser.get("Paths", "linelists"))
-        self.path_model_atmospheres = os.path.abspath(
-            config_parser.get("Paths", "model_atmospheres")
-        )
-        self.path_output_directory = os.path.abspath(
-            config_parser.get("Paths", "output_directory")
-        )
+        for attribute, value in settings.items():
+            if attribute in _PATH_ATTRIBUTES:
+                value = os.path.abspath(value)
+            setattr(self, attribute, value)
 
-        self.wavelength_min = config_parser.getfloat(
-            "Atmosphere_parameters", "wavelength_min"
-        )
+    def _read_configuration_file(self):
+        """
+        Read the configuration file and parse the configuration parameters.
 
-        self.wavelength_max = config_parser.getfloat(
-            "Atmosphere_parameters", "wavelength_max"
-        )
-        self.wavelength_step = config_parser.getfloat(
-            "Atmosphere_parameters", "wavelength_step"
-        )
+        Parameters in the configuration file must be explicity listed in one of the settings
+        tables at the top of this module, meaning that additions to the configuration file
+        will not be recognised by the program unless they are added to a table.
+        Args:
+            self (Configuration): The configuration object.
+        Returns:
+            dict: The configuration parameters, with the names of the attributes as keys.
+        """
+        # Read configuration file into plain dictionaries,
+        # so each parameter is a dictionary lookup
+        with open(self.config_file, "r") as file:
+            sections = _parse_configuration_text(file.read())
 
-        self.read_stellar_parameters_from_file = config_parser.getboolean(
-            "Stellar_parameters", "read_from_file"
-        )
+        settings = _read_settings(sections, GENERAL_SETTINGS)
 
         # Only load these parameters if stellar parameters should be generated,
         # since they're not needed if the stellar parameters are read from a file
-        if self.read_stellar_parameters_from_file == False:
-            self.random_parameters = config_parser.getboolean(
-                "Stellar_parameters", "random_parameters"
-            )
-            self.teff_min = config_parser.getint("Stellar_parameters", "teff_min")
-            self.teff_max = config_parser.getint("Stellar_parameters", "teff_max")
-            self.logg_min = config_parser.getfloat("Stellar_parameters", "logg_min")
-            self.logg_max = config_parser.getfloat("Stellar_parameters", "logg_max")
-            self.z_min = config_parser.getfloat("Stellar_parameters", "z_min")
-            self.z_max = config_parser.getfloat("Stellar_parameters", "z_max")
-            self.mg_min = config_parser.getfloat("Stellar_parameters", "mg_min")
-            self.mg_max = config_parser.getfloat("Stellar_parameters", "mg_max")
-            self.ca_min = config_parser.getfloat("Stellar_parameters", "ca_min")
-            self.ca_max = config_parser.getfloat("Stellar_parameters", "ca_max")
+        if settings["read_stellar_parameters_from_file"] == False:
+            settings.update(_read_settings(sections, STELLAR_PARAMETER_SETTINGS))
 
             # Load settings for parameter generation
             # If random parameters are specified, the number of sets to generate is needed
-            if self.random_parameters == True:
-                self.num_spectra = config_parser.getint(
-                    "Random_settings", "num_spectra"
+            if settings["random_parameters"] == True:
+                settings.update(_read_settings(sections, RANDOM_SETTINGS))
+                settings.update(
+                    _read_settings(sections, OPTIONAL_RANDOM_SETTINGS, optional=True)
                 )
             # If evenly spaced parameters are specified, the number of points for each parameter is needed
             else:
-                self.num_points_teff = config_parser.getint(
-                    "Even_settings", "num_points_teff"
-                )
-                self.num_points_logg = config_parser.getint(
-                    "Even_settings", "num_points_logg"
-                )
-                self.num_points_z = config_parser.getint(
-                    "Even_settings", "num_points_z"
-                )
-                self.num_points_mg = config_parser.getint(
-                    "Even_settings", "num_points_mg"
-                )
-                self.num_points_ca = config_parser.getint(
-                    "Even_settings", "num_points_ca"
-                )
+                settings.update(_read_settings(sections, EVEN_SETTINGS))
         else:
-            self.path_input_parameters = os.path.abspath(
-                config_parser.get("Paths", "input_parameters")
-            )
+            settings.update(_read_settings(sections, INPUT_FILE_SETTINGS))
 
-        self.xit = config_parser.getfloat("Turbospectrum_settings", "xit")
+        return settings
 
     def _validate_turbospectrum_path(self):
         """
@@ -168,10 +411,11 @@ class Configuration:
         Raises:
             FileNotFoundError: If the path to the Turbospectrum directory does not exist.
         """
-        if not os.path.exists(self.path_turbospectrum):
-            raise FileNotFoundError(
-                f"The specified directory containing Turbospectrum {self.config_file} does not exist."
-            )
+        _require_path(
+            self.path_turbospectrum,
+            is_directory=True,
+            error_message=f"The specified directory containing Turbospectrum {self.path_turbospectrum} does not exist.",
+        )
 
     def _validate_interpolator_path(self):
         """
@@ -182,14 +426,34 @@ class Configuration:
         Raises:
             FileNotFoundError: If the path to the interpolator directory does not exist.
         """
-        if not os.path.exists(self.path_interpolator):
-            raise FileNotFoundError(
-                f"The specified directory containing the interpolator {self.path_interpolator} does not exist."
-            )
+        _require_path(
+            self.path_interpolator,
+            is_directory=True,
+            error_message=f"The specified directory containing the interpolator {self.path_interpolator} does not exist.",
+        )
+
+    @property
+    def path_turbospectrum_compiled(self):
+        """
+        The path to the directory containing the compiled Turbospectrum executables.
+
+        The path depends on the compiler and the path to Turbospectrum, so it is worked out
+        from their current values each time it is used.
+        Args:
+            self (Configuration): The configuration object.
+        Returns:
+            str: The path to the directory containing the compiled Turbospectrum executables.
+        Raises:
+            ValueError: If the compiler is not supported.
+        """
+        self._validate_compiler()
+        return os.path.join(
+            self.path_turbospectrum, COMPILED_DIRECTORIES[self.compiler]
+        )
 
     def _validate_compiler(self):
         """
-        Check that the compiler is supported and set the path to the compiled Turbospectrum executable.
+        Check that the compiler is supported.
 
         Suported compilers are "intel" and "gfortran".
         Args:
@@ -197,21 +461,15 @@ class Configuration:
         Raises:
             ValueError: If the compiler is not supported.
         """
-        if self.compiler == "intel":
-            self.path_turbospectrum_compiled = os.path.join(
-                self.path_turbospectrum, "exec"
-            )
-        elif self.compiler == "gfortran":
-            self.path_turbospectrum_compiled = os.path.join(
-                self.path_turbospectrum, "exec-gf"
-            )
-        else:
+        if self.compiler not in COMPILED_DIRECTORIES:
             raise ValueError(f"Compiler {self.compiler} is not supported.")
 
     def _validate_paths_to_directories(self):
         """
         Check that all paths to directories exist.
 
+        The directories may be on a network file system, so they are checked at the same time
+        in separate threads, instead of waiting for each check to finish before starting the next.
         Args:
             self (Configuration): The configuration object.
         Raises:
@@ -222,11 +480,17 @@ class Configuration:
             self.path_model_atmospheres,
             self.path_output_directory,
         ]
-        for path in paths:
-            if not os.path.exists(path):
-                raise FileNotFoundError(
-                    f"The specified directory {path} does not exist."
-                )
+
+        def require_directory(path):
+            _require_path(
+                path,
+                is_directory=True,
+                error_message=f"The specified directory {path} does not exist.",
+            )
+
+        # Errors are raised in the order of the paths, when the results are collected
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            list(executor.map(require_directory, paths))
 
     def _validate_path_to_input_parameters(self):
         """
@@ -237,10 +501,11 @@ class Configuration:
         Raises:
             FileNotFoundError: If the path to the input parameters file does not exist.
         """
-        if not os.path.exists(self.path_input_parameters):
-            raise FileNotFoundError(
-                f"The specified file {self.path_input_parameters} does not exist."
-            )
+        _require_path(
+            self.path_input_parameters,
+            is_directory=False,
+            error_message=f"The specified file {self.path_input_parameters} does not exist.",
+        )
 
     def _validate_wavelength_range(self):
         """
@@ -270,14 +535,12 @@ class Configuration:
         Args:
             self (Configuration): The configuration object.
         """
-        self._validate_effective_temperature()
-        self._validate_surface_gravity()
-        self._validate_metallicity()
-        self._validate_magnesium_abundance()
-        self._validate_calcium_abundance()
+        for parameter in STELLAR_PARAMETER_RANGES:
+            self._validate_parameter_range(parameter)
 
         if self.random_parameters == True:
             self._validate_number_of_spectra()
+            self._validate_seed()
         else:
             self._validate_evenly_spaced_parameters_points()
 
@@ -295,104 +558,44 @@ class Configuration:
                 f"The number of spectra {self.num_spectra} must be greater than 0."
             )
 
-    def _validate_effective_temperature(self):
+    def _validate_seed(self):
         """
-        Check that the effective temperature range is valid.
-
-        The temperature cannot be negative and the minimum temperature must be smaller than the maximum temperature.
+        Check that the seed for the random number generator, if given, is not negative.
 
         Args:
             self (Configuration): The configuration object.
         Raises:
-            ValueError: If any effective temperature parameter is negative or if the minimum effective temperature is greater than the maximum effective temperature.
+            ValueError: If the seed is negative.
         """
-        if self.teff_min < 0:
-            raise ValueError(
-                f"The minimum effective temperature {self.teff_min} must be positive."
-            )
-
-        if self.teff_max < 0:
-            raise ValueError(
-                f"The maximum effective temperature {self.teff_max} must be positive."
-            )
+        if self.seed is not None and self.seed < 0:
+            raise ValueError(f"The seed {self.seed} must not be negative.")
 
-        if self.teff_min >= self.teff_max:
-            raise ValueError(
-                f"The minimum effective temperature {self.teff_min} must be smaller than the maximum effective temperature {self.teff_max}."
-            )
-
-    def _validate_surface_gravity(self):
+    def _validate_parameter_range(self, parameter):
         """
-        Check that the surface gravity range is valid.
+        Check that the range of a stellar parameter is valid.
 
+        The minimum value must be smaller than the maximum value. Parameters marked as non-negative
+        in STELLAR_PARAMETER_RANGES cannot have negative values.
         Args:
             self (Configuration): The configuration object.
+            parameter (str): The name of the parameter, e.g. "teff".
         Raises:
-            ValueError: If any surface gravity parameter is negative or if the minimum surface gravity is greater than the maximum surface gravity.
+            ValueError: If any value of a non-negative parameter is negative or if the minimum value is greater than the maximum value.
         """
-        # TODO: Change the limit to 2
-        # TODO: Don't raise error, print warning and let the program continuer.
-        if self.logg_min < 0:
-            raise ValueError(
-                f"The minimum surface gravity {self.logg_min} must be positive."
-            )
+        name, non_negative = STELLAR_PARAMETER_RANGES[parameter]
+        minimum = getattr(self, f"{parameter}_min")
+        maximum = getattr(self, f"{parameter}_max")
 
-        if self.logg_max < 0:
-            raise ValueError(
-                f"The maximum surface gravity {self.logg_max} must be positive."
-            )
-
-        if self.logg_min >= self.logg_max:
-            raise ValueError(
-                f"The minimum surface gravity {self.logg_min} must be smaller than the maximum surface gravity {self.logg_max}."
-            )
-
-    def _validate_metallicity(self):
-        """
-        Check that the metallicity range is valid.
+        if non_negative:
+            if minimum < 0:
+                raise ValueError(f"The minimum {name} {minimum} must be positive.")
 
-        The minimum metallicity must be smaller than the maximum metallicity.
+            if maximum < 0:
+                raise ValueError(f"The maximum {name} {maximum} must be positive.")
 
-        Args:
-            self (Configuration): The configuration object.
-        Raises:
-            ValueError: If the minimum metallicity is greater than the maximum metallicity.
-        """
-        if self.z_min >= self.z_max:
+        if minimum >= maximum:
             raise ValueError(
-                f"The minimum metallicity {self.z_min} must be smaller than the maximum metallicity {self.z_max}."
-            )
-
-    def _validate_magnesium_abundance(self):
-        """
-        Check that the magnesium abundance range is valid.
-
-        The minimum magnesium abundance must be smaller than the maximum magnesium abundance.
-
-        Args:
-            self (Configuration): The configuration object.
-        Raises:
-            ValueError: If the minimum magnesium abundance is greater than the maximum magnesium abundance.
-        """
-        if self.mg_min >= self.mg_max:
-            raise ValueError(
-                f"The minimum magnesium abundance {self.mg_min} must be smaller than the maximum magnesium abundance {self.mg_max}."
-            )
-
-    def _validate_calcium_abundance(self):
-        """
-        Check that the calcium abundance range is valid.
-
-        The minimum calcium abundance must be smaller than the maximum calcium abundance.
-
-        Args:
-            self (Configuration): The configuration object.
-        Raises:
-            ValueError: If the minimum calcium abundance is greater than the maximum calcium abundance.
-        """
-        if self.ca_min >= self.ca_max:
-            raise ValueError(
-                f"The minimum calcium abundance {self.ca_min} must be smaller than the maximum calcium abundance {self.ca_max}."
+                f"The minimum {name} {minimum} must be smaller than the maximum {name} {maximum}."
             )
 
     def _validate_evenly_spaced_parameters_points(self):
@@ -419,15 +622,25 @@ class Configuration:
         """
         A wrapper function that checks if all required parameters are set and within range.
 
+        The paths are always checked, since the files and directories may have been changed
+        since the configuration was last created. The values in a configuration file that
+        has already been validated, and has not been changed since, are not checked again.
         Args:
             self (Configuration): The configuration object.
         """
         self._validate_turbospectrum_path()
-        self._validate_compiler()
         self._validate_paths_to_directories()
-        self._validate_wavelength_range()
 
         if self.read_stellar_parameters_from_file == True:
             self._validate_path_to_input_parameters()
-        else:
+
+        if self._config_file_key in _VALIDATED_CONFIGURATION_FILES:
+            return
+
+        self._validate_compiler()
+        self._validate_wavelength_range()
+
+        if self.read_stellar_parameters_from_file == False:
             self._validate_stellar_parameters()
+
+        _VALIDATED_CONFIGURATION_FILES.add(self._config_file_key)
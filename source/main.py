@@ -2,37 +2,49 @@ import logging
 import time
 
 from source.configuration_setup import Configuration
-from source.output_management import (
-    copy_config_file,
-    remove_temp_files,
-    set_up_output_directory,
-)
-from source.parameter_generation import generate_parameters
-from source.turbospectrum_integration.compilation import (
-    compile_interpolator,
-    compile_turbospectrum,
-)
-from source.turbospectrum_integration.interpolation import (
-    create_template_interpolator_script,
-)
-from source.turbospectrum_integration.run_turbospectrum import generate_all_spectra
-from source.turbospectrum_integration.utils import collect_model_atmosphere_parameters
+
+logger = logging.getLogger(__name__)
 
 
 def main():
     # TODO: Add functionality to read path from commandline
-    # Set up logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-    )
+    # Set up logging, unless the program is run from code that has already configured it
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(asctime)s - %(levelname)s - %(message)s",
+        )
 
     start_time = time.time()
 
     try:
-        # Initialize configuration
+        # Initialize configuration. A new object is created for each run, since the path
+        # to the output directory is changed when the output directory is set up.
+        # Parsing and validation of an unchanged configuration file are still cached
         config = Configuration()
 
+        # The rest of the program is imported once the configuration has been validated,
+        # so that an invalid configuration is reported without first importing numpy and pandas
+        from source.output_management import (
+            copy_config_file,
+            remove_temp_files,
+            set_up_output_directory,
+        )
+        from source.parameter_generation import generate_parameters
+        from source.turbospectrum_integration.compilation import (
+            compile_interpolator,
+            compile_turbospectrum,
+        )
+        from source.turbospectrum_integration.interpolation import (
+            create_template_interpolator_script,
+        )
+        from source.turbospectrum_integration.run_turbospectrum import (
+            generate_all_spectra,
+        )
+        from source.turbospectrum_integration.utils import (
+            collect_model_atmosphere_parameters,
+        )
+
         # Set up output directory
         set_up_output_directory(config)
 
@@ -53,9 +65,10 @@ def main():
 
         # Create template for interpolator script
         create_template_interpolator_script(config)
-    except Exception as e:
-        logging.error(f"Error during setup: {e}")
-        raise e
+    except Exception:
+        # Log the error with its traceback, and re-raise it without changing the traceback
+        logger.exception("Error during setup")
+        raise
 
     # Generate all spectra
     generate_all_spectra(config, model_atmospheres, stellar_parameters)
@@ -67,7 +80,7 @@ def main():
 
     end_time = time.time()
     elapsed_time = end_time - start_time
-    logging.info(f"Total execution time: {elapsed_time:.2f} seconds")
+    logger.info(f"Total execution time: {elapsed_time:.2f} seconds")
 
 
 if __name__ == "__main__":
@@ -1,26 +1,43 @@
 from datetime import datetime
-from os import makedirs
+from os import mkdir, path
 from shutil import copyfile, rmtree
 
 from source.configuration_setup import Configuration
 
+# Date and time the program was started, as YYYY-MM-DD_HHMM,
+# used to name the output directory of this run
+_RUN_TIMESTAMP = datetime.now().strftime("%Y-%m-%d_%H%M")
+
 
 def set_up_output_directory(config: Configuration):
     """
     Create the output directory and a subdirectory for temp files
 
+    The output directory is named after the date and time the program was started.
+    If a directory with that name already exists, because another run was started in the same minute,
+    a number is added to the name of the directory.
     Args:
         config (Configuration): Configuration object contining the path to the output directory to be created
     """
-    # Get current date and time as YYYYMMDD_HHMM
-    now = datetime.now().strftime("%Y-%m-%d_%H%M")
-
     # Create the path to the output directory
-    config.path_output_directory = f"{config.path_output_directory}/{now}"
-
-    # Create the directory + subdirectory for temp files
-    makedirs(config.path_output_directory)
-    makedirs(f"{config.path_output_directory}/temp")
+    output_directory = path.join(config.path_output_directory, _RUN_TIMESTAMP)
+
+    # Create the output directory itself with a call that fails if it already exists,
+    # so that a directory from an earlier run is never reused, even after its temp
+    # directory has been removed
+    run_number = 1
+    config.path_output_directory = output_directory
+    while True:
+        try:
+            mkdir(config.path_output_directory)
+            break
+        except FileExistsError:
+            # Try the next number instead of failing
+            run_number += 1
+            config.path_output_directory = f"{output_directory}_{run_number}"
+
+    # Create the subdirectory for temp files in the new output directory
+    mkdir(path.join(config.path_output_directory, "temp"))
 
 
 def copy_config_file(config: Configuration):
@@ -30,7 +47,7 @@ def copy_config_file(config: Configuration):
     Args:
         config (Configuration): Configuration object containing the path to the configuration file and the output directory
     """
-    copyfile(config.path_config, f"{config.path_output_directory}/config.cfg")
+    copyfile(config.path_config, path.join(config.path_output_directory, "config.cfg"))
 
 
 def generate_parameter_file(
@@ -49,36 +66,44 @@ def generate_parameter_file(
         no_files_found_for_interpolation (list): List of dictionaries containing the parameter sets for which no files were found for interpolation
         multiple_files_found_for_interpolation (list): List of dictionaries containing the parameter sets for which multiple files were found for interpolation
     """
-    # Create a file in the output directory
-    with open(f"{config.path_output_directory}/stellar_parameters.txt", "w") as file:
-
-        if no_files_found_for_interpolation:
-            file.write("----------------------------------------\n")
-            file.write("No spectrum generated because files\n")
-            file.write("needed for interpolation were not found:\n")
-            file.write("----------------------------------------\n")
+    # Collect the content of the file and write it all at once
+    lines = []
+
+    if no_files_found_for_interpolation:
+        lines.append("----------------------------------------\n")
+        lines.append("No spectrum generated because files\n")
+        lines.append("needed for interpolation were not found:\n")
+        lines.append("----------------------------------------\n")
+
+        lines.extend(
+            f"{parameter_set}\n" for parameter_set in no_files_found_for_interpolation
+        )
+
+    if multiple_files_found_for_interpolation:
+        lines.append("\n\n----------------------------------------\n")
+        lines.append("No spectrum generated because multiple\n")
+        lines.append("matching model atmospheres were found\n")
+        lines.append("for interpolation:\n")
+        lines.append("----------------------------------------\n")
+
+        lines.extend(
+            f"{parameter_set}\n"
+            for parameter_set in multiple_files_found_for_interpolation
+        )
+
+    lines.append("\n\n----------------------------------------\n")
+    lines.append("Spectra generated:\n")
+    lines.append("----------------------------------------\n")
+    # Write successful parameters
+    lines.extend(f"{parameter_set}\n" for parameter_set in successful_parameters)
 
-            for parameter_set in no_files_found_for_interpolation:
-                file.write(f"{parameter_set}\n")
-
-        if multiple_files_found_for_interpolation:
-            file.write("\n\n----------------------------------------\n")
-            file.write("No spectrum generated because multiple\n")
-            file.write("matching model atmospheres were found\n")
-            file.write("for interpolation:\n")
-            file.write("----------------------------------------\n")
-
-            for parameter_set in multiple_files_found_for_interpolation:
-                file.write(f"{parameter_set}\n")
-
-        file.write("\n\n----------------------------------------\n")
-        file.write("Spectra generated:\n")
-        file.write("----------------------------------------\n")
-        # Write successful parameters
-        for parameter_set in successful_parameters:
-            file.write(f"{parameter_set}\n")
+    # Create a file in the output directory
+    with open(
+        path.join(config.path_output_directory, "stellar_parameters.txt"), "w"
+    ) as file:
+        file.write("".join(lines))
 
 
 def remove_temp_files(config: Configuration):
     # Remove the temp directory
-    rmtree(f"{config.path_output_directory}/temp")
+    rmtree(path.join(config.path_output_directory, "temp"))
@@ -1,8 +1,9 @@
 import os
-import random
 import sys
+from itertools import product
 
 import numpy as np
+import pandas as pd
 from source.configuration_setup import Configuration
 
 # Parameters required in an input file provided by the user
@@ -46,8 +47,21 @@ def read_parameters_from_file(config: Configuration):
         config (Configuration): Configuration object containing the path to the input file
     Returns:
         list: List of dictionaries containing the stellar parameters
+    Raises:
+        FileNotFoundError: If the input file does not exist
+        ValueError: If a row in the input file does not have one value for each parameter in the header
     """
-    with open(config.path_input_parameters, "r", newline="") as file:
+    # Handle a missing file when opening it, instead of checking that it exists first.
+    # The file may have been removed since the configuration was validated
+    try:
+        file = open(config.path_input_parameters, "r", newline="")
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"The specified file {config.path_input_parameters} does not exist."
+        ) from None
+
+    # The file is only opened once, the header is read first and the rest of the file is left for pandas
+    with file:
         # Read the header to get column names
         header = file.readline().strip().split()
 
@@ -57,28 +71,42 @@ def read_parameters_from_file(config: Configuration):
 
         except ValueError as e:
             print(e)
-            sys.exit(
-                1
-            )  # We don't want to continue if the required parameters are missing
-
-        all_stellar_parameters = []
-
-        # Read file content
-        for line in file:
-            # Split the line into a list of values
-            values = line.strip().split()
+            # We don't want to continue if the required parameters are missing
+            sys.exit(1)
 
-            float_values = [float(value) for value in values]
-
-            # Create a dictionary with the header as keys and the values from this line
-            stellar_parameters = dict(zip(header, float_values))
+        # Parse the rest of the file at once. The rows are read without column names and
+        # without an index column, so that a row with too many or too few values can be
+        # detected instead of pandas shifting or padding the values to fit the header.
+        # The round trip parser gives the same values as float(), unlike pandas' default parser
+        try:
+            parameters = pd.read_csv(
+                file,
+                sep=r"\s+",
+                header=None,
+                index_col=False,
+                dtype=float,
+                float_precision="round_trip",
+            )
+        except pd.errors.EmptyDataError:
+            # The file only contains the header
+            return []
+        except pd.errors.ParserError:
+            raise ValueError(
+                f"Every row in {config.path_input_parameters} must have one value for each parameter in the header."
+            ) from None
+
+        # A row with fewer values than the others is padded with NaN
+        if len(parameters.columns) != len(header) or parameters.isna().values.any():
+            raise ValueError(
+                f"Every row in {config.path_input_parameters} must have one value for each parameter in the header."
+            )
+        parameters.columns = header
 
-            # Add the dictionary to the list of all stellar parameters
-            all_stellar_parameters.append(stellar_parameters)
+    # Convert teff values to integers, for the whole column at once
+    parameters["teff"] = parameters["teff"].astype(int)
 
-        # Convert teff values to integers
-        for parameter_set in all_stellar_parameters:
-            parameter_set["teff"] = int(parameter_set["teff"])
+    # Create a dictionary for each line, with the header as keys
+    all_stellar_parameters = parameters.to_dict("records")
 
     return all_stellar_parameters
 
@@ -98,7 +126,13 @@ def _within_min_delta(new_parameter, existing, min_delta):
 
 
 def _validate_new_set(
-    teff: int, logg: float, z: float, mg: float, ca: float, parameters: dict
+    teff: int,
+    logg: float,
+    z: float,
+    mg: float,
+    ca: float,
+    parameters: dict,
+    teff_index: dict = None,
 ):
     """
     Check if a new set of stellar parameters is valid, i.e. if it is outside the minimum distance of any existing set.
@@ -111,16 +145,28 @@ def _validate_new_set(
         mg (float): Abundance of magnesium
         ca (float): Abundance of calcium
         parameters (dict): A dictionary containing lists of existing parameters
+        teff_index (dict, optional): A dictionary mapping each existing teff value to the indices of the sets
+        with that value. If given, only the sets with a teff value within the minimum distance are looked up,
+        instead of comparing against every existing set. Defaults to None.
 
     Returns:
         bool: True if the new set is valid, False otherwise
     """
     # Get all parameter sets who's teff value are within the minimum distance from teff
-    teff_collisions = [
-        i
-        for i, existing_teff in enumerate(parameters["teff"])
-        if _within_min_delta(teff, existing_teff, MIN_PARAMETER_DELTA["teff"])
-    ]
+    if teff_index is None:
+        teff_collisions = [
+            i
+            for i, existing_teff in enumerate(parameters["teff"])
+            if _within_min_delta(teff, existing_teff, MIN_PARAMETER_DELTA["teff"])
+        ]
+    else:
+        # teff values are integers, so only the values strictly within the minimum distance need to be looked up
+        min_delta = MIN_PARAMETER_DELTA["teff"]
+        teff_collisions = [
+            i
+            for existing_teff in range(teff - min_delta + 1, teff + min_delta)
+            for i in teff_index.get(existing_teff, ())
+        ]
 
     # In the subset of parameter sets that have "the same" teff value as the candidate set,
     # check if any of them have logg values within the minimum distance from logg
@@ -157,12 +203,14 @@ def _validate_new_set(
     return True
 
 
-def generate_random_parameters(config: Configuration):
+def generate_random_parameters(config: Configuration, seed: int = None):
     """
     Generate random stellar parameters
 
     Args:
         config (Configuration): Configuration object containing ranges and step sizes for the parameters to be generated
+        seed (int, optional): Seed for the random number generator. The same seed gives the same parameters,
+        which makes runs reproducible. Defaults to None, which gives different parameters each run.
 
     Returns:
         list: List of dictionaries containing the generated stellar parameters
@@ -176,25 +224,41 @@ def generate_random_parameters(config: Configuration):
     # Storage for parameters and links between them (index)
     parameters = {"teff": [], "logg": [], "z": [], "ca": [], "mg": []}
 
+    # Indices of the stored sets for each teff value, so that a new set is only
+    # compared against the sets with a close teff value instead of against all sets
+    teff_index = {}
+
     # Storage for generated sets
     completed_sets = []
 
+    rng = np.random.default_rng(seed)
+
     while len(completed_sets) < config.num_spectra:
-        teff = random.randint(*teff_range)
-        logg = round(random.uniform(*logg_range), 2)
-        z = round(random.uniform(*z_range), 3)
-        mg = round(random.uniform(*mg_range), 3)
-        ca = round(random.uniform(*ca_range), 3)
-
-        if _validate_new_set(teff, logg, z, mg, ca, parameters):
-            parameters["teff"].append(teff)
-            parameters["logg"].append(logg)
-            parameters["z"].append(z)
-            parameters["mg"].append(mg)
-            parameters["ca"].append(ca)
-            completed_sets.append(
-                {"teff": teff, "logg": logg, "z": z, "mg": mg, "ca": ca}
-            )
+        # Draw candidates for all remaining sets at once, instead of one value at a time.
+        # Candidates that collide with an existing set are replaced in the next round
+        num_candidates = config.num_spectra - len(completed_sets)
+        candidates = zip(
+            rng.integers(teff_range[0], teff_range[1] + 1, num_candidates).tolist(),
+            np.round(rng.uniform(*logg_range, num_candidates), 2).tolist(),
+            np.round(rng.uniform(*z_range, num_candidates), 3).tolist(),
+            np.round(rng.uniform(*mg_range, num_candidates), 3).tolist(),
+            np.round(rng.uniform(*ca_range, num_candidates), 3).tolist(),
+        )
+
+        for teff, logg, z, mg, ca in candidates:
+            if len(completed_sets) == config.num_spectra:
+                break
+
+            if _validate_new_set(teff, logg, z, mg, ca, parameters, teff_index):
+                teff_index.setdefault(teff, []).append(len(parameters["teff"]))
+                parameters["teff"].append(teff)
+                parameters["logg"].append(logg)
+                parameters["z"].append(z)
+                parameters["mg"].append(mg)
+                parameters["ca"].append(ca)
+                completed_sets.append(
+                    {"teff": teff, "logg": logg, "z": z, "mg": mg, "ca": ca}
+                )
 
     return completed_sets
 
@@ -224,22 +288,19 @@ def generate_evenly_spaced_parameters(config: Configuration):
         np.linspace(config.ca_min, config.ca_max, config.num_points_ca), 3
     )
 
-    # Generate all combinations of the parameter values
-    parameter_sets = []
-    for t in teff_values:
-        for logg in logg_values:
-            for z in z_values:
-                for mg in mg_values:
-                    for ca in ca_values:
-                        parameter_sets.append(
-                            {
-                                "teff": t,
-                                "logg": round(logg, 2),
-                                "z": round(z, 3),
-                                "mg": round(mg, 3),
-                                "ca": round(ca, 3),
-                            }
-                        )
+    # Generate all combinations of the parameter values, in the same order as nested loops
+    # over teff, logg, z, mg and ca would. The values are converted to Python floats once per
+    # parameter, and the combinations are produced one at a time instead of as full grids
+    parameter_sets = [
+        {"teff": t, "logg": logg, "z": z, "mg": mg, "ca": ca}
+        for t, logg, z, mg, ca in product(
+            teff_values.tolist(),
+            logg_values.tolist(),
+            z_values.tolist(),
+            mg_values.tolist(),
+            ca_values.tolist(),
+        )
+    ]
     return parameter_sets
 
 
@@ -260,18 +321,17 @@ def generate_parameters(config: Configuration):
     if config.read_stellar_parameters_from_file:
         parameters = read_parameters_from_file(config)
     elif config.random_parameters:
-        parameters = generate_random_parameters(config)
+        parameters = generate_random_parameters(config, seed=config.seed)
     else:
         parameters = generate_evenly_spaced_parameters(config)
 
     # Write parameters to a file in the output directory
     output_file = os.path.join(config.path_output_directory, "generated_parameters.txt")
+    headers = parameters[0].keys()
+    # Collect the header and one line per set of parameters, and write them all at once
+    lines = [" ".join(headers)]
+    lines.extend(" ".join(str(param[key]) for key in headers) for param in parameters)
     with open(output_file, "w") as file:
-        # Write the header
-        headers = parameters[0].keys()
-        file.write(" ".join(headers) + "\n")
-        # Write the parameters
-        for param in parameters:
-            file.write(" ".join(str(param[key]) for key in headers) + "\n")
+        file.write("\n".join(lines) + "\n")
 
     return parameters
@@ -1,5 +1,5 @@
-from os import chdir, getcwd
-from subprocess import CalledProcessError, run
+from os import cpu_count
+from subprocess import DEVNULL, PIPE, CalledProcessError, run
 
 from source.configuration_setup import Configuration
 
@@ -9,6 +9,7 @@ def compile_turbospectrum(config: Configuration):
     Compile Turbospectrum using the Makefile located in Turbospectrum's directory.
 
     This function is run once each time the program is run.
+    The source files are compiled in parallel, using one make job per CPU core.
     Args:
         config (Configuration): The Configuration object containing paths to the Turbospectrum directory.
 
@@ -16,20 +17,23 @@ def compile_turbospectrum(config: Configuration):
         subprocess.CalledProcessError: If the compilation of Turbospectrum fails.
     """
 
-    cwd = getcwd()
-    # Change the current working directory to where the Turbospectrum's Makefile is located
-    chdir(config.path_turbospectrum_compiled)
-
     try:
-        # Run make command to compile Turbospectrum
-        result = run(["make"], check=True, text=True, capture_output=True)
+        # Run make command to compile Turbospectrum, with one job per CPU core.
+        # make is run in the directory where Turbospectrum's Makefile is located,
+        # without changing the working directory of this process.
+        # The build log is discarded instead of held in memory, only errors are kept
+        run(
+            ["make", f"-j{cpu_count() or 1}"],
+            check=True,
+            text=True,
+            stdout=DEVNULL,
+            stderr=PIPE,
+            cwd=config.path_turbospectrum_compiled,
+        )
         print(f"Compilation of Turbospectrum successful")
     except CalledProcessError as e:
         print(f"Error compiling Turbospectrum: {e.stderr}")
         raise e
-    finally:
-        # Change back to the original working directory
-        chdir(cwd)
 
 
 def compile_interpolator(config: Configuration):
@@ -47,20 +51,21 @@ def compile_interpolator(config: Configuration):
         subprocess.CalledProcessError: If the compilation of the interpolator fails.
     """
 
-    cwd = getcwd()
-    # Change the current working directory to where the interpolator is located
-    chdir(config.path_interpolator)
-
     # Command from readme: gfortran -o interpol_modeles interpol_modeles.f
     command = [config.compiler, "-o", "interpol_modeles", "interpol_modeles.f"]
 
     try:
-        # Run command to compile interpolator
-        result = run(command, check=True, text=True, capture_output=True)
+        # Run command to compile interpolator in the directory where it is located,
+        # only keeping the errors
+        run(
+            command,
+            check=True,
+            text=True,
+            stdout=DEVNULL,
+            stderr=PIPE,
+            cwd=config.path_interpolator,
+        )
         print(f"Compilation of interpolator successful")
     except CalledProcessError as e:
         print(f"Error compiling interpolator: {e.stderr}")
         raise e
-    finally:
-        # Change back to the original working directory
-        chdir(cwd)
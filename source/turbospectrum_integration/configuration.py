@@ -1,4 +1,5 @@
-from os import chdir, getcwd, listdir, path
+from functools import lru_cache
+from os import chdir, getcwd, scandir
 from subprocess import PIPE, run
 
 from source.configuration_setup import Configuration
@@ -45,19 +46,36 @@ SPHERICAL: .false.
 
 class TurbospectrumConfiguration:
 
+    # One instance is created per spectrum, and the attributes are fixed,
+    # so they are stored in slots instead of a per-instance dictionary
+    __slots__ = (
+        "alpha",
+        "file_name",
+        "path_model_atmosphere",
+        "path_model_opac",
+        "path_babsma",
+        "path_bsyn",
+        "path_result",
+        "interpolated_model_atmosphere",
+        "num_elements",
+        "abundance_str",
+    )
+
     def __init__(self, config: Configuration, stellar_parameters: dict):
         self.alpha = calculate_alpha(stellar_parameters["z"])
         self.file_name = compose_filename(stellar_parameters, self.alpha)
 
+        # All paths are built from the output directory and the file name,
+        # which are read once. The temporary files are stored in the temp subdirectory
+        output_directory = config.path_output_directory
+        file_name = self.file_name
+        temp_directory = output_directory + "/temp/"
+
         self.path_model_atmosphere = None
-        self.path_model_opac = (
-            f"{config.path_output_directory}/temp/opac_{self.file_name}"
-        )
-        self.path_babsma = (
-            f"{config.path_output_directory}/temp/{self.file_name}_babsma"
-        )
-        self.path_bsyn = f"{config.path_output_directory}/temp/{self.file_name}_bsyn"
-        self.path_result = f"{config.path_output_directory}/{self.file_name}.spec"
+        self.path_model_opac = temp_directory + "opac_" + file_name
+        self.path_babsma = temp_directory + file_name + "_babsma"
+        self.path_bsyn = temp_directory + file_name + "_bsyn"
+        self.path_result = output_directory + "/" + file_name + ".spec"
         self.interpolated_model_atmosphere = True
 
         set_abundances(self, stellar_parameters)
@@ -215,27 +233,35 @@ def create_line_lists_str(config: Configuration):
         config (Configuration): The Configuration object containing the path to the directory
         with the line lists.
 
+    Returns:
+        str: A string with the paths to the line lists, separated by newlines.
+    """
+    # The string is the same for every spectrum in a run, so it is cached per directory
+    return _line_lists_str(config.path_linelists)
+
+
+@lru_cache(maxsize=None)
+def _line_lists_str(directory: str):
+    """
+    Scan a directory for line lists and format their paths for the bsyn script.
+
+    Args:
+        directory (str): Path to the directory with the line lists.
+
     Returns:
         str: A string with the paths to the line lists, separated by newlines.
     """
     # TODO: Add error handling? What if the directory is empty? Or contains other files than line lists?
-    directory = config.path_linelists
-    # Gather all file paths in the directory into a list
-    line_list_paths = [
-        path.join(directory, file)
-        for file in listdir(directory)
-        if path.isfile(path.join(directory, file))
-    ]
+    # Gather all file paths in the directory into a list. scandir reports the entry type
+    # along with the name, so no extra stat call is needed per file
+    with scandir(directory) as entries:
+        line_list_paths = [entry.path for entry in entries if entry.is_file()]
 
     # Format the list as a string containing the keyword needed for the bsyn script,
     # with each path on a new line
-    line_lists_str = "NFILES: {:d}".format(len(line_list_paths))
-    for file in line_list_paths:
-        line_lists_str += "\n{}".format(file)
-
-    line_lists_str += "\n"
-
-    return line_lists_str
+    return "NFILES: {:d}\n".format(len(line_list_paths)) + "".join(
+        "{}\n".format(file) for file in line_list_paths
+    )
 
 
 def create_bsyn(
@@ -1,7 +1,7 @@
-import concurrent.futures
-import copy
-from os import chdir, getcwd
-from subprocess import PIPE, run
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from os import chdir, cpu_count, getcwd
+from subprocess import STDOUT, run
 
 from pandas import DataFrame
 from source.configuration_setup import Configuration
@@ -40,19 +40,16 @@ def run_babsma(ts_config: TurbospectrumConfiguration, config: Configuration):
     chdir(config.path_turbospectrum)
 
     try:
-        with open(ts_config.path_babsma, "r") as file:
-            result = run(
+        # Write the output of babsma directly to the log file, instead of holding it in memory
+        with open(ts_config.path_babsma, "r") as file, open(
+            log_file_path, "w"
+        ) as log_file:
+            run(
                 [babsma_executable],
                 stdin=file,
-                stdout=PIPE,
-                stderr=PIPE,
-                text=True,
+                stdout=log_file,
+                stderr=STDOUT,
             )
-            with open(log_file_path, "w") as log_file:
-                log_file.write("Standard Output:\n")
-                log_file.write(result.stdout)
-                log_file.write("\n\nStandard Error:\n")
-                log_file.write(result.stderr)
     except Exception as e:
         print(f"Error running babsma: {e}")
         raise e
@@ -83,19 +80,16 @@ def run_bsyn(ts_config: TurbospectrumConfiguration, config: Configuration):
     chdir(config.path_turbospectrum)
 
     try:
-        with open(ts_config.path_bsyn, "r") as file:
-            result = run(
+        # Write the output of bsyn directly to the log file, instead of holding it in memory
+        with open(ts_config.path_bsyn, "r") as file, open(
+            log_file_path, "w"
+        ) as log_file:
+            run(
                 [bsyn_executable],
                 stdin=file,
-                stdout=PIPE,
-                stderr=PIPE,
-                text=True,
+                stdout=log_file,
+                stderr=STDOUT,
             )
-            with open(log_file_path, "w") as log_file:
-                log_file.write("Standard Output:\n")
-                log_file.write(result.stdout)
-                log_file.write("\n\nStandard Error:\n")
-                log_file.write(result.stderr)
     except Exception as e:
         print(f"Error running bsyn: {e}")
         raise e
@@ -163,32 +157,46 @@ def generate_one_spectrum(
     run_bsyn(ts_config, config)
 
 
+def _generate_one_spectrum_worker(
+    config: Configuration, model_atmospheres: DataFrame, stellar_parameters: dict
+):
+    """
+    Generate a spectrum in a worker process.
+
+    Errors are caught and printed so that a failing set of stellar parameters
+    does not stop the generation of the remaining spectra.
+    Args:
+        config (Configuration): The Configuration object
+        model_atmospheres (DataFrame): The DataFrame containing the model atmospheres
+        stellar_parameters (dict): The stellar parameters for which to generate the spectrum
+    """
+    try:
+        generate_one_spectrum(config, stellar_parameters, model_atmospheres)
+    except Exception as e:
+        print(f"Error generating spectrum: {e}")
+
+
 def generate_all_spectra(
     config: Configuration, model_atmospheres: DataFrame, stellar_parameters: list
 ):
     """
     Generate spectra for all sets of stellar parameters.
 
+    The spectra are generated in parallel, using one process per CPU core.
+    Processes are used instead of threads since babsma, bsyn and the interpolator
+    change the working directory, which is shared by all threads in a process.
     Args:
         config (Configuration): The Configuration object
         model_atmospheres (DataFrame): The DataFrame containing the model atmospheres
         stellar_parameters (list): The list of stellar parameters for which to generate spectra
     """
-    # for parameter_set in stellar_parameters:
-    #     generate_one_spectrum(config, parameter_set, model_atmospheres)
-
-    def worker(parameter_set):
-        config_copy = copy.deepcopy(config)
-        generate_one_spectrum(config_copy, parameter_set, model_atmospheres)
-
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        futures = [
-            executor.submit(worker, parameter_set)
-            for parameter_set in stellar_parameters
-        ]
-        for future in concurrent.futures.as_completed(futures):
-            try:
-                future.result()
-            except Exception as e:
-                print(f"Error generating spectrum: {e}")
-                # raise e
+    num_workers = cpu_count() or 1
+
+    # Send the parameter sets to the workers in chunks to reduce the overhead of
+    # inter-process communication, while keeping the chunks small enough for
+    # the work to be evenly distributed between the workers
+    chunksize = max(1, len(stellar_parameters) // (4 * num_workers))
+
+    worker = partial(_generate_one_spectrum_worker, config, model_atmospheres)
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        list(executor.map(worker, stellar_parameters, chunksize=chunksize))
@@ -1,9 +1,10 @@
 import os
 import unittest
 from shutil import rmtree
+from tempfile import TemporaryDirectory
 from unittest.mock import MagicMock, patch
 
-from source.configuration_setup import Configuration
+from source.configuration_setup import Configuration, _parse_configuration_text
 
 
 # Run tests with this command: python3 -m unittest tests.test_config
@@ -81,33 +82,235 @@ class TestConfigurationSetup(unittest.TestCase):
             config.config_file, os.path.abspath("tests/test_input/configuration.cfg")
         )
 
-    @patch("source.configuration_setup.os.path.exists", return_value=False)
-    def test_non_existing_config_file(self, mock_exists):
+    def test_configurations_of_same_file_are_independent(self):
+        """
+        Test that changing one configuration object does not change another one created from the same config file
+        """
+        config = Configuration("tests/test_input/configuration.cfg")
+        other_config = Configuration("tests/test_input/configuration.cfg")
+        config.path_output_directory = os.path.join(
+            config.path_output_directory, "2024-05-04_1200"
+        )
+        self.assertNotEqual(
+            config.path_output_directory, other_config.path_output_directory
+        )
+
+    def test_changed_config_file_parsed_again(self):
+        """
+        Test that the config file is parsed again if it has been changed
+        """
+        with open("tests/test_input/configuration.cfg", "r") as f:
+            content = f.read()
+        with open("tests/test_input/changed_configuration.cfg", "w") as f:
+            f.write(content)
+        config = Configuration("tests/test_input/changed_configuration.cfg")
+
+        with open("tests/test_input/changed_configuration.cfg", "w") as f:
+            f.write(content.replace("num_spectra = 10", "num_spectra = 100"))
+        changed_config = Configuration("tests/test_input/changed_configuration.cfg")
+
+        self.assertEqual(config.num_spectra, 10)
+        self.assertEqual(changed_config.num_spectra, 100)
+
+    def test_unchanged_config_file_only_parsed_once(self):
+        """
+        Test that the config file is not parsed again if it has not been changed
+        """
+        Configuration("tests/test_input/configuration.cfg")
+        with patch(
+            "source.configuration_setup.Configuration._read_configuration_file"
+        ) as mock_read:
+            config = Configuration("tests/test_input/configuration.cfg")
+        mock_read.assert_not_called()
+        self.assertEqual(config.num_spectra, 10)
+
+    def test_relative_paths_resolved_against_working_directory(self):
+        """
+        Test that relative paths in a cached config file are resolved against the current working directory
+        """
+        with open("tests/test_input/configuration.cfg", "r") as f:
+            content = f.read().replace("./tests/test_input/", "./")
+
+        with TemporaryDirectory() as directory:
+            # Create the configured directories both next to the config file and in a subdirectory
+            for base in (directory, os.path.join(directory, "sub")):
+                for subdirectory in (
+                    "turbospectrum/interpolator",
+                    "turbospectrum/exec-gf",
+                    "linelists",
+                    "model_atmospheres",
+                    "output",
+                ):
+                    os.makedirs(os.path.join(base, subdirectory))
+            with open(os.path.join(directory, "configuration.cfg"), "w") as f:
+                f.write(content)
+
+            self.addCleanup(os.chdir, os.getcwd())
+            os.chdir(directory)
+            config = Configuration("configuration.cfg")
+            os.chdir("sub")
+            sub_config = Configuration("../configuration.cfg")
+
+            self.assertEqual(
+                config.path_turbospectrum,
+                os.path.join(os.path.realpath(directory), "turbospectrum"),
+            )
+            self.assertEqual(
+                sub_config.path_turbospectrum,
+                os.path.join(os.path.realpath(directory), "sub", "turbospectrum"),
+            )
+
+    def test_unchanged_config_file_only_validated_once(self):
+        """
+        Test that the values in the config file are not validated again if it has not been changed
+        """
+        Configuration("tests/test_input/configuration.cfg")
+        with patch(
+            "source.configuration_setup.Configuration._validate_wavelength_range"
+        ) as mock_validate:
+            Configuration("tests/test_input/configuration.cfg")
+        mock_validate.assert_not_called()
+
+    def test_removed_directory_detected_for_unchanged_config_file(self):
+        """
+        Test that the paths are checked again even if the config file has not been changed
+        """
+        Configuration("tests/test_input/configuration.cfg")
+        os.rmdir("tests/test_input/linelists")
+        self.addCleanup(os.makedirs, "tests/test_input/linelists", exist_ok=True)
+        with self.assertRaises(FileNotFoundError):
+            Configuration("tests/test_input/configuration.cfg")
+
+    def test_seed_read_from_config_file(self):
+        """
+        Test that the optional seed is read from the config file, and is None if it is left out
+        """
+        config = Configuration("tests/test_input/configuration.cfg")
+        self.assertIsNone(config.seed)
+
+        with open("tests/test_input/configuration.cfg", "r") as f:
+            content = f.read()
+        with open("tests/test_input/seeded_configuration.cfg", "w") as f:
+            f.write(
+                content.replace("num_spectra = 10\n", "num_spectra = 10\nseed = 42\n")
+            )
+        seeded_config = Configuration("tests/test_input/seeded_configuration.cfg")
+        self.assertEqual(seeded_config.seed, 42)
+
+    def test_negative_seed(self):
+        """
+        Test that an error is raised if the seed is negative
+        """
+        config = Configuration("tests/test_input/configuration.cfg")
+        config.seed = -1
+        with self.assertRaises(ValueError):
+            config._validate_seed()
+
+    def test_negative_seed_in_config_file(self):
+        """
+        Test that a negative seed in the config file is reported when the configuration is created
+        """
+        with open("tests/test_input/configuration.cfg", "r") as f:
+            content = f.read()
+        with open("tests/test_input/negative_seed_configuration.cfg", "w") as f:
+            f.write(
+                content.replace("num_spectra = 10\n", "num_spectra = 10\nseed = -1\n")
+            )
+        with self.assertRaises(ValueError):
+            Configuration("tests/test_input/negative_seed_configuration.cfg")
+
+    def test_missing_parameter(self):
+        """
+        Test that a missing parameter in the config file raises a ValueError naming it
+        """
+        config = Configuration("tests/test_input/configuration.cfg")
+        config.config_file = "tests/test_input/missing_parameter.cfg"
+        with open(config.config_file, "w") as f:
+            f.write("[Turbospectrum_compiler]\n")
+            f.write("Compiler = gfortran\n")
+        with self.assertRaises(ValueError) as context:
+            config._read_configuration_file()
+        self.assertIn("turbospectrum", str(context.exception))
+
+    def test_parse_configuration_text(self):
+        """
+        Test that sections, case-insensitive keys and values are parsed and comments are skipped
+        """
+        text = (
+            "# Comment\n"
+            "[Paths]\n"
+            "; Another comment\n"
+            "Turbospectrum = ./turbospectrum/ \n"
+            "\n"
+            "[Turbospectrum_settings]\n"
+            "xit = 1.0\n"
+            "XIT_unit: km/s\n"
+        )
+        self.assertEqual(
+            _parse_configuration_text(text),
+            {
+                "Paths": {"turbospectrum": "./turbospectrum/"},
+                "Turbospectrum_settings": {"xit": "1.0", "xit_unit": "km/s"},
+            },
+        )
+
+    def test_parse_configuration_text_invalid_line(self):
+        """
+        Test that a line that is not a section, key or comment raises a ValueError
+        """
+        with self.assertRaises(ValueError):
+            _parse_configuration_text("[Paths]\nturbospectrum\n")
+
+    def test_parse_configuration_text_repeated_key(self):
+        """
+        Test that a key repeated within a section raises a ValueError
+        """
+        with self.assertRaises(ValueError):
+            _parse_configuration_text(
+                "[Random_settings]\nnum_spectra = 10\nnum_spectra = 1000\n"
+            )
+
+    def test_parse_configuration_text_repeated_section(self):
+        """
+        Test that a repeated section raises a ValueError
+        """
+        with self.assertRaises(ValueError):
+            _parse_configuration_text(
+                "[Random_settings]\nnum_spectra = 10\n[Random_settings]\nseed = 1\n"
+            )
+
+    def test_unknown_attribute_cannot_be_set(self):
+        """
+        Test that only the attributes declared in the slots can be set
+        """
+        config = Configuration("tests/test_input/configuration.cfg")
+        with self.assertRaises(AttributeError):
+            config.wavelenght_min = 5700
+
+    def test_non_existing_config_file(self):
         """
         Test that an error is raised if the config file does not exist
         """
         with self.assertRaises(FileNotFoundError):
             Configuration("tests/non_existing_config.cfg")
 
-    @patch("source.configuration_setup.os.path.exists", return_value=True)
     @patch("source.configuration_setup.Configuration._load_configuration_file")
     @patch("source.configuration_setup.Configuration._validate_configuration")
-    def test_errors_caught_in_constructor(self, mock_validate, mock_load, mock_exists):
+    def test_errors_raised_from_constructor(self, mock_validate, mock_load):
         """
-        Test that errors are caught in the constructor
+        Test that validation errors are raised to the caller of the constructor
         """
         mock_validate.side_effect = ValueError()
-        with self.assertRaises(SystemExit) as cm:
+        with self.assertRaises(ValueError):
             Configuration()
-        self.assertEqual(cm.exception.code, 1)
 
-    @patch("source.configuration_setup.os.path.exists", return_value=True)
-    def test_validate_turbospectrum_path_success(self, mock_exists):
+    def test_validate_turbospectrum_path_success(self):
         """
         Test that an error is not raised if the path to Turbospectrum exists
         """
         config = Configuration("tests/test_input/configuration.cfg")
-        self.assertTrue(os.path.exists(config.path_turbospectrum))
+        self.assertTrue(os.path.isdir(config.path_turbospectrum))
+        config._validate_turbospectrum_path()
 
     def test_validate_turbospectrum_path_failure(self):
         """
@@ -118,13 +321,13 @@ class TestConfigurationSetup(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             config._validate_turbospectrum_path()
 
-    @patch("source.configuration_setup.os.path.exists", return_value=True)
-    def test_validate_interpolator_path_success(self, mock_exists):
+    def test_validate_interpolator_path_success(self):
         """
         Test that an error is not raised if the path to the interpolator exists
         """
         config = Configuration("tests/test_input/configuration.cfg")
-        self.assertTrue(os.path.exists(config.path_interpolator))
+        self.assertTrue(os.path.isdir(config.path_interpolator))
+        config._validate_interpolator_path()
 
     def test_validate_interpolator_path_failure(self):
         """
@@ -160,6 +363,28 @@ class TestConfigurationSetup(unittest.TestCase):
             os.path.abspath("tests/test_input/turbospectrum/exec"),
         )
 
+    def test_path_through_file(self):
+        """
+        Test that a path running through a file is reported as a missing directory
+        """
+        config = Configuration("tests/test_input/configuration.cfg")
+        config.path_linelists = "tests/test_input/input_parameters.txt/linelists"
+        with self.assertRaises(FileNotFoundError):
+            config._validate_paths_to_directories()
+
+    def test_path_turbospectrum_compiled_follows_compiler(self):
+        """
+        Test that the path to the compiled Turbospectrum changes if the compiler is changed after it has been used
+        """
+        config = Configuration("tests/test_input/configuration.cfg")
+        config.compiler = "gfortran"
+        config.path_turbospectrum_compiled
+        config.compiler = "intel"
+        self.assertEqual(
+            config.path_turbospectrum_compiled,
+            os.path.abspath("tests/test_input/turbospectrum/exec"),
+        )
+
     def test_invalid_compiler(self):
         """
         Test that an error is raised if the compiler is not supported
@@ -169,16 +394,25 @@ class TestConfigurationSetup(unittest.TestCase):
         with self.assertRaises(ValueError):
             config._validate_compiler()
 
-    @patch("source.configuration_setup.os.path.exists", return_value=True)
-    def test_validate_path_to_directories_success(self, mock_exists):
+    def test_invalid_compiler_path_turbospectrum_compiled(self):
+        """
+        Test that an error is raised if the path to Turbospectrum is used with an unsupported compiler
+        """
+        config = Configuration("tests/test_input/configuration.cfg")
+        config.compiler = "invalid_compiler"
+        with self.assertRaises(ValueError):
+            config.path_turbospectrum_compiled
+
+    def test_validate_path_to_directories_success(self):
         """
         Test that the path validation works when the paths exist
         """
         config = Configuration("tests/test_input/configuration.cfg")
-        self.assertTrue(os.path.exists(config.path_turbospectrum))
-        self.assertTrue(os.path.exists(config.path_linelists))
-        self.assertTrue(os.path.exists(config.path_model_atmospheres))
-        self.assertTrue(os.path.exists(config.path_output_directory))
+        self.assertTrue(os.path.isdir(config.path_turbospectrum))
+        self.assertTrue(os.path.isdir(config.path_linelists))
+        self.assertTrue(os.path.isdir(config.path_model_atmospheres))
+        self.assertTrue(os.path.isdir(config.path_output_directory))
+        config._validate_paths_to_directories()
 
     def test_invalid_path_linelists(self):
         """
@@ -207,6 +441,15 @@ class TestConfigurationSetup(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             config._validate_paths_to_directories()
 
+    def test_path_linelists_not_a_directory(self):
+        """
+        Test that an error is raised if the path to linelists is a file instead of a directory
+        """
+        config = Configuration("tests/test_input/configuration.cfg")
+        config.path_linelists = "tests/test_input/input_parameters.txt"
+        with self.assertRaises(FileNotFoundError):
+            config._validate_paths_to_directories()
+
     def test_invalid_path_input_parameters(self):
         """
         Test that an error is raised if the path to input parameters does not exist
@@ -313,7 +556,7 @@ class TestConfigurationSetup(unittest.TestCase):
         config.teff_min = 7000
         config.teff_max = 5000
         with self.assertRaises(ValueError):
-            config._validate_effective_temperature()
+            config._validate_parameter_range("teff")
 
     def test_invalid_teff_min_negative(self):
         """
@@ -322,7 +565,7 @@ class TestConfigurationSetup(unittest.TestCase):
         config = Configuration("tests/test_input/configuration.cfg")
         config.teff_min = -1
         with self.assertRaises(ValueError):
-            config._validate_effective_temperature()
+            config._validate_parameter_range("teff")
 
     def test_invalid_teff_max_negative(self):
         """
@@ -331,7 +574,7 @@ class TestConfigurationSetup(unittest.TestCase):
         config = Configuration("tests/test_input/configuration.cfg")
         config.teff_max = -1
         with self.assertRaises(ValueError):
-            config._validate_effective_temperature()
+            config._validate_parameter_range("teff")
 
     def test_invalid_logg_min_larger_than_max(self):
         """
@@ -341,7 +584,7 @@ class TestConfigurationSetup(unittest.TestCase):
         config.logg_min = 5.0
         config.logg_max = 4.0
         with self.assertRaises(ValueError):
-            config._validate_surface_gravity()
+            config._validate_parameter_range("logg")
 
     def test_invalid_logg_min_negative(self):
         """
@@ -350,7 +593,7 @@ class TestConfigurationSetup(unittest.TestCase):
         config = Configuration("tests/test_input/configuration.cfg")
         config.logg_min = -1
         with self.assertRaises(ValueError):
-            config._validate_surface_gravity()
+            config._validate_parameter_range("logg")
 
     def test_invalid_logg_max_negative(self):
         """
@@ -359,7 +602,7 @@ class TestConfigurationSetup(unittest.TestCase):
         config = Configuration("tests/test_input/configuration.cfg")
         config.logg_max = -1
         with self.assertRaises(ValueError):
-            config._validate_surface_gravity()
+            config._validate_parameter_range("logg")
 
     def test_invalid_z_min_larger_than_max(self):
         """
@@ -369,7 +612,7 @@ class TestConfigurationSetup(unittest.TestCase):
         config.z_min = 0.5
         config.z_max = -1.0
         with self.assertRaises(ValueError):
-            config._validate_metallicity()
+            config._validate_parameter_range("z")
 
     def test_no_stellar_parameters_loaded_if_read_from_file(self):
         """
@@ -503,7 +746,7 @@ class TestConfigurationSetup(unittest.TestCase):
         config.mg_min = 1.2
         config.mg_max = -0.8
         with self.assertRaises(ValueError):
-            config._validate_magnesium_abundance()
+            config._validate_parameter_range("mg")
 
     def test_invalid_ca_range(self):
         """
@@ -513,7 +756,7 @@ class TestConfigurationSetup(unittest.TestCase):
         config.ca_min = 1.2
         config.ca_max = -0.8
         with self.assertRaises(ValueError):
-            config._validate_calcium_abundance()
+            config._validate_parameter_range("ca")
 
     def test_validate_evenly_spaced_parameter_points(self):
         """
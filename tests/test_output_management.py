@@ -1,5 +1,6 @@
 import unittest
-from unittest.mock import MagicMock, mock_open, patch
+from tempfile import TemporaryDirectory
+from unittest.mock import MagicMock, call, mock_open, patch
 
 import source.output_management as output_management
 from source.configuration_setup import Configuration
@@ -7,16 +8,13 @@ from source.configuration_setup import Configuration
 
 class TestOutputManagement(unittest.TestCase):
 
-    @patch("source.output_management.makedirs")
-    @patch("source.output_management.datetime")
-    def test_set_up_output_directory(self, mock_datetime, mock_makedirs):
+    @patch("source.output_management.mkdir")
+    @patch("source.output_management._RUN_TIMESTAMP", "2024-05-04_1200")
+    def test_set_up_output_directory(self, mock_mkdir):
         """
         Test that the output directory is created with the correct name and a subdirectory for temp files
         """
         print("Running output test")
-        # Mock the current date and time
-        mock_now = mock_datetime.now.return_value
-        mock_now.strftime.return_value = "2024-05-04_1200"
 
         # Create a mock Configuration object
         config = MagicMock(spec=Configuration)
@@ -31,9 +29,56 @@ class TestOutputManagement(unittest.TestCase):
 
         self.assertEqual(config.path_output_directory, expected_output_directory)
 
-        # Verify that os.makedirs was called with the correct arguments
-        mock_makedirs.assert_any_call(expected_output_directory)
-        mock_makedirs.assert_any_call(expected_temp_directory)
+        # Verify that the output directory and the temp directory were created
+        mock_mkdir.assert_has_calls(
+            [call(expected_output_directory), call(expected_temp_directory)]
+        )
+
+    @patch("source.output_management.mkdir")
+    @patch("source.output_management._RUN_TIMESTAMP", "2024-05-04_1200")
+    def test_set_up_output_directory_already_exists(self, mock_mkdir):
+        """
+        Test that a number is added to the name of the output directory if it already exists
+        """
+        mock_mkdir.side_effect = [FileExistsError, None, None]
+
+        # Create a mock Configuration object
+        config = MagicMock(spec=Configuration)
+        config.path_output_directory = "/path/to/output"
+
+        # Call the function
+        output_management.set_up_output_directory(config)
+
+        self.assertEqual(
+            config.path_output_directory, "/path/to/output/2024-05-04_1200_2"
+        )
+        mock_mkdir.assert_has_calls(
+            [
+                call("/path/to/output/2024-05-04_1200"),
+                call("/path/to/output/2024-05-04_1200_2"),
+                call("/path/to/output/2024-05-04_1200_2/temp"),
+            ]
+        )
+
+    @patch("source.output_management._RUN_TIMESTAMP", "2024-05-04_1200")
+    def test_set_up_output_directory_after_temp_files_removed(self):
+        """
+        Test that the output directory of an earlier run is not reused after its temp files have been removed
+        """
+        with TemporaryDirectory() as output_directory:
+            first_config = MagicMock(spec=Configuration)
+            first_config.path_output_directory = output_directory
+            output_management.set_up_output_directory(first_config)
+            output_management.remove_temp_files(first_config)
+
+            second_config = MagicMock(spec=Configuration)
+            second_config.path_output_directory = output_directory
+            output_management.set_up_output_directory(second_config)
+
+            self.assertEqual(
+                second_config.path_output_directory,
+                f"{output_directory}/2024-05-04_1200_2",
+            )
 
     @patch("source.output_management.copyfile")
     def test_copy_config_file(self, mock_copyfile):
@@ -109,32 +154,8 @@ class TestOutputManagement(unittest.TestCase):
             f"{successful_parameters[1]}\n"
         )
 
-        # Verify that the file was written with the correct content
-        file_handle.write.assert_any_call("----------------------------------------\n")
-        file_handle.write.assert_any_call("No spectrum generated because files\n")
-        file_handle.write.assert_any_call("needed for interpolation were not found:\n")
-        file_handle.write.assert_any_call("----------------------------------------\n")
-        file_handle.write.assert_any_call(f"{no_files_found_for_interpolation[0]}\n")
-        file_handle.write.assert_any_call(f"{no_files_found_for_interpolation[1]}\n")
-        file_handle.write.assert_any_call(
-            "\n\n----------------------------------------\n"
-        )
-        file_handle.write.assert_any_call("No spectrum generated because multiple\n")
-        file_handle.write.assert_any_call("matching model atmospheres were found\n")
-        file_handle.write.assert_any_call("for interpolation:\n")
-        file_handle.write.assert_any_call("----------------------------------------\n")
-        file_handle.write.assert_any_call(
-            f"{multiple_files_found_for_interpolation[0]}\n"
-        )
-        file_handle.write.assert_any_call(
-            f"{multiple_files_found_for_interpolation[1]}\n"
-        )
-        file_handle.write.assert_any_call(
-            "\n\n----------------------------------------\n"
-        )
-        file_handle.write.assert_any_call("Spectra generated:\n")
-        file_handle.write.assert_any_call(f"{successful_parameters[0]}\n")
-        file_handle.write.assert_any_call(f"{successful_parameters[1]}\n")
+        # Verify that the file was written with the correct content, in a single call
+        file_handle.write.assert_called_once_with(expected_content)
 
     @patch("source.output_management.open", new_callable=mock_open)
     def test_generate_parameter_file_only_successful_parameters(self, mock_open):
@@ -174,14 +195,8 @@ class TestOutputManagement(unittest.TestCase):
             f"{successful_parameters[1]}\n"
         )
 
-        # Verify that the file was written with the correct content
-        file_handle.write.assert_any_call(
-            "\n\n----------------------------------------\n"
-        )
-        file_handle.write.assert_any_call("Spectra generated:\n")
-        file_handle.write.assert_any_call("----------------------------------------\n")
-        file_handle.write.assert_any_call(f"{successful_parameters[0]}\n")
-        file_handle.write.assert_any_call(f"{successful_parameters[1]}\n")
+        # Verify that the file was written with the correct content, in a single call
+        file_handle.write.assert_called_once_with(expected_content)
 
     @patch("source.output_management.rmtree")
     def test_remove_temp_files(self, mock_rmtree):
@@ -164,6 +164,75 @@ class TestParameterGeneration(unittest.TestCase):
             ],
         )
 
+    def test_read_parameters_from_file_teff_is_integer(self):
+        """
+        Test that the effective temperatures read from the input file are integers
+        """
+        config = Configuration("tests/test_input/configuration.cfg")
+        config.path_input_parameters = "tests/test_input/input_parameters.txt"
+        stellar_parameters = parameter_generation.read_parameters_from_file(config)
+        self.assertTrue(
+            all(
+                isinstance(parameter_set["teff"], int)
+                for parameter_set in stellar_parameters
+            )
+        )
+
+    def test_read_parameters_from_file_missing_file(self):
+        """
+        Test that an error is raised if the input file does not exist
+        """
+        config = Configuration("tests/test_input/configuration.cfg")
+        config.path_input_parameters = "tests/test_input/non_existing_parameters.txt"
+        with self.assertRaises(FileNotFoundError) as context:
+            parameter_generation.read_parameters_from_file(config)
+        self.assertIn(config.path_input_parameters, str(context.exception))
+
+    def test_read_parameters_from_file_full_precision(self):
+        """
+        Test that values with full precision are read exactly as float() parses them
+        """
+        # Values that pandas' default parser reads 1 ulp away from float()
+        values = ["0.9409883428551487", "5.1128471185033515", "-0.9411400085659261"]
+        config = Configuration("tests/test_input/configuration.cfg")
+        config.path_input_parameters = "tests/test_input/input_parameters_precision.txt"
+        with open(config.path_input_parameters, "w") as f:
+            f.write("teff logg z mg ca\n")
+            f.write(f"5000 {values[1]} {values[2]} {values[0]} {values[0]}\n")
+        self.addCleanup(os.remove, config.path_input_parameters)
+        stellar_parameters = parameter_generation.read_parameters_from_file(config)
+        self.assertEqual(
+            [stellar_parameters[0][key] for key in ("logg", "z", "mg")],
+            [float(values[1]), float(values[2]), float(values[0])],
+        )
+
+    def test_read_parameters_from_file_too_many_values(self):
+        """
+        Test that an error is raised if a row in the input file has more values than the header
+        """
+        config = Configuration("tests/test_input/configuration.cfg")
+        config.path_input_parameters = "tests/test_input/input_parameters_ragged.txt"
+        with open(config.path_input_parameters, "w") as f:
+            f.write("teff logg z mg ca\n")
+            f.write("5000 4.5 0.1 0.2 0.3 9.9\n")
+        self.addCleanup(os.remove, config.path_input_parameters)
+        with self.assertRaises(ValueError):
+            parameter_generation.read_parameters_from_file(config)
+
+    def test_read_parameters_from_file_too_few_values(self):
+        """
+        Test that an error is raised if a row in the input file has fewer values than the header
+        """
+        config = Configuration("tests/test_input/configuration.cfg")
+        config.path_input_parameters = "tests/test_input/input_parameters_ragged.txt"
+        with open(config.path_input_parameters, "w") as f:
+            f.write("teff logg z mg ca\n")
+            f.write("5000 4.5 0.1 0.2 0.3\n")
+            f.write("5100 4.5 0.1 0.2\n")
+        self.addCleanup(os.remove, config.path_input_parameters)
+        with self.assertRaises(ValueError):
+            parameter_generation.read_parameters_from_file(config)
+
     @patch("source.parameter_generation.sys.exit")
     def test_read_parameters_from_file_missing_parameters(self, mock_exit):
         """
@@ -205,9 +274,7 @@ class TestParameterGeneration(unittest.TestCase):
                 )
             )
 
-    @patch("source.parameter_generation.random.randint")
-    @patch("source.parameter_generation.random.uniform")
-    def test_generate_random_parameters_no_conflicts(self, mock_randint, mock_uniform):
+    def test_generate_random_parameters_no_conflicts_varying_abundances(self):
         """
         Test that the function successfully adds 10 randomly generated sets of stellar parameters when there are no conflicting parameter values.
         Obs: This test is sensitive regarding the number of parameters to generate. If num_spectra in config is changed, the expected values must be updated, and the mock numbers.
@@ -284,9 +351,15 @@ class TestParameterGeneration(unittest.TestCase):
             {"teff": 5045, "logg": 5.00, "z": 0.500, "mg": 0.6, "ca": -0.4},
         ]
 
-        with patch("source.parameter_generation.random.randint"), patch(
-            "source.parameter_generation.random.uniform"
-        ):
+        with patch(
+            "source.parameter_generation.np.random.default_rng"
+        ) as mock_default_rng:
+            # Each column of candidates is drawn in one call, teff first and then logg, z, mg and ca
+            mock_rng = mock_default_rng.return_value
+            mock_rng.integers.return_value = np.array(randint_values)
+            mock_rng.uniform.side_effect = [
+                np.array(uniform_values[i::4]) for i in range(4)
+            ]
             result = parameter_generation.generate_random_parameters(config)
             self.assertEqual(len(result), 10)
             self.assertTrue(
@@ -295,84 +368,30 @@ class TestParameterGeneration(unittest.TestCase):
 
             self.assertEqual(result, expected)
 
-    @patch("source.parameter_generation.random.randint")
-    @patch("source.parameter_generation.random.uniform")
-    def test_generate_random_parameters_with_mixed_collisions(
-        self, mock_randint, mock_uniform
-    ):
+    def test_generate_random_parameters_with_mixed_collisions(self):
         """
-        Test that the function handles a mix of valid and conflicting parameter sets.
+        Test that the function handles a mix of valid and conflicting parameter sets,
+        drawing new candidates for the conflicting sets in a second round.
         """
-        # Set up mock values to create a mix of valid and conflicting sets
-        randint_values = [
-            5000,
-            5005,
-            5000,
-            5010,
-            5000,
-            5015,
-            5020,
-            5025,
-            5030,
-            5035,
-            5040,
-            5050,
-            5060,
+        # Set up mock values to create a mix of valid and conflicting sets.
+        # The first round draws 10 candidates, of which 3 conflict with an earlier set,
+        # so the second round draws 3 new candidates
+        first_round = [
+            (5000, 4.00, -1.000, 0.1, 0.2),
+            (5005, 4.06, -0.899, 0.2, 0.1),
+            (5000, 4.00, -1.000, 0.1, 0.2),  # Conflict
+            (5010, 4.12, -0.799, 0.3, 0.0),
+            (5000, 4.00, -1.000, 0.1, 0.2),  # Conflict
+            (5015, 4.18, -0.699, 0.0, -0.1),
+            (5020, 4.24, -0.599, -0.1, -0.2),
+            (5025, 4.30, -0.499, -0.2, 0.3),
+            (5030, 4.36, -0.399, 0.4, -0.3),
+            (5005, 4.06, -0.899, 0.2, 0.1),  # Conflict
         ]
-        # Logg, z, mg, and ca values, interleaved
-        uniform_values = [
-            4.00,
-            -1.000,
-            0.1,
-            0.2,  # Conflict
-            4.06,
-            -0.899,
-            0.2,
-            0.1,
-            4.00,
-            -1.000,
-            0.1,
-            0.2,  # Conflict
-            4.12,
-            -0.799,
-            0.3,
-            0.0,
-            4.00,
-            -1.000,
-            0.1,
-            0.2,  # Conflict
-            4.18,
-            -0.699,
-            0.0,
-            -0.1,
-            4.24,
-            -0.599,
-            -0.1,
-            -0.2,
-            4.30,
-            -0.499,
-            -0.2,
-            0.3,
-            4.36,
-            -0.399,
-            0.4,
-            -0.3,
-            4.42,
-            -0.299,
-            0.5,
-            0.4,
-            4.48,
-            -0.199,
-            -0.4,
-            0.5,
-            4.54,
-            -0.099,
-            0.6,
-            -0.4,  # Ensure we have enough unique values to reach 10 sets
-            4.60,
-            0.000,
-            0.7,
-            0.6,
+        second_round = [
+            (5035, 4.42, -0.299, 0.5, 0.4),
+            (5040, 4.48, -0.199, -0.4, 0.5),
+            (5050, 4.54, -0.099, 0.6, -0.4),
         ]
 
         config = Configuration("tests/test_input/configuration.cfg")
@@ -389,21 +408,32 @@ class TestParameterGeneration(unittest.TestCase):
             {"teff": 5050, "logg": 4.54, "z": -0.099, "mg": 0.6, "ca": -0.4},
         ]
 
+        # Each column of candidates is drawn in one call per round, teff first and then logg, z, mg and ca
+        first_columns = [np.array(column) for column in zip(*first_round)]
+        second_columns = [np.array(column) for column in zip(*second_round)]
+
         with patch(
-            "source.parameter_generation.random.randint", side_effect=randint_values
-        ), patch(
-            "source.parameter_generation.random.uniform", side_effect=uniform_values
-        ):
+            "source.parameter_generation.np.random.default_rng"
+        ) as mock_default_rng:
+            mock_rng = mock_default_rng.return_value
+            mock_rng.integers.side_effect = [first_columns[0], second_columns[0]]
+            mock_rng.uniform.side_effect = first_columns[1:] + second_columns[1:]
             result = parameter_generation.generate_random_parameters(config)
-            self.assertEqual(len(result), 10)
-            self.assertTrue(all(len(parameter_set) == 5 for parameter_set in result))
-            self.assertEqual(result, expected)
 
-    @patch("random.randint")
-    @patch("random.uniform")
-    def test_generate_random_parameters_with_teff_collisions(
-        self, mock_randint, mock_uniform
-    ):
+        self.assertEqual(len(result), 10)
+        self.assertTrue(all(len(parameter_set) == 5 for parameter_set in result))
+        self.assertEqual(result, expected)
+
+        # Check that each round drew exactly as many candidates as there were sets left to generate
+        self.assertEqual(
+            [draw.args[-1] for draw in mock_rng.integers.call_args_list], [10, 3]
+        )
+        self.assertEqual(
+            [draw.args[-1] for draw in mock_rng.uniform.call_args_list],
+            [10] * 4 + [3] * 4,
+        )
+
+    def test_generate_random_parameters_with_teff_collisions(self):
         """
         Test that the function successfully adds 10 randomly generated sets of stellar parameters when there are conflicting teff values, but no collisions in logg, z, mg, and ca values.
         """
@@ -468,19 +498,21 @@ class TestParameterGeneration(unittest.TestCase):
             {"teff": 5000, "logg": 4.54, "z": -0.099, "mg": 0.6, "ca": -0.4},
         ]
 
-        with patch("random.randint", side_effect=randint_values), patch(
-            "random.uniform", side_effect=uniform_values
-        ):
+        with patch(
+            "source.parameter_generation.np.random.default_rng"
+        ) as mock_default_rng:
+            # Each column of candidates is drawn in one call, teff first and then logg, z, mg and ca
+            mock_rng = mock_default_rng.return_value
+            mock_rng.integers.return_value = np.array(randint_values)
+            mock_rng.uniform.side_effect = [
+                np.array(uniform_values[i::4]) for i in range(4)
+            ]
             result = parameter_generation.generate_random_parameters(config)
             self.assertEqual(len(result), 10)
             self.assertTrue(all(len(parameter_set) == 5 for parameter_set in result))
             self.assertEqual(result, expected)
 
-    @patch("random.randint")
-    @patch("random.uniform")
-    def test_generate_random_parameters_with_teff_and_logg_collisions(
-        self, mock_randint, mock_uniform
-    ):
+    def test_generate_random_parameters_with_teff_and_logg_collisions(self):
         """
         Test that the function successfully adds 10 randomly generated sets of stellar parameters when there are conflicting teff and logg values, but no collisions in z, mg, and ca values.
         """
@@ -545,14 +577,44 @@ class TestParameterGeneration(unittest.TestCase):
             {"teff": 5000, "logg": 4.0, "z": -0.199, "mg": -0.4, "ca": 0.5},
             {"teff": 5000, "logg": 4.0, "z": -0.099, "mg": 0.6, "ca": -0.4},
         ]
-        with patch("random.randint", side_effect=randint_values), patch(
-            "random.uniform", side_effect=uniform_values
-        ):
+        with patch(
+            "source.parameter_generation.np.random.default_rng"
+        ) as mock_default_rng:
+            # Each column of candidates is drawn in one call, teff first and then logg, z, mg and ca
+            mock_rng = mock_default_rng.return_value
+            mock_rng.integers.return_value = np.array(randint_values)
+            mock_rng.uniform.side_effect = [
+                np.array(uniform_values[i::4]) for i in range(4)
+            ]
             result = parameter_generation.generate_random_parameters(config)
             self.assertEqual(len(result), 10)
             self.assertTrue(all(len(parameter_set) == 5 for parameter_set in result))
             self.assertEqual(result, expected)
 
+    def test_generate_random_parameters_within_ranges(self):
+        """
+        Test that the generated stellar parameters are within the ranges in the configuration
+        """
+        config = Configuration("tests/test_input/configuration.cfg")
+        result = parameter_generation.generate_random_parameters(config)
+        self.assertEqual(len(result), config.num_spectra)
+        for parameter_set in result:
+            self.assertIsInstance(parameter_set["teff"], int)
+            self.assertTrue(config.teff_min <= parameter_set["teff"] <= config.teff_max)
+            self.assertTrue(config.logg_min <= parameter_set["logg"] <= config.logg_max)
+            self.assertTrue(config.z_min <= parameter_set["z"] <= config.z_max)
+            self.assertTrue(config.mg_min <= parameter_set["mg"] <= config.mg_max)
+            self.assertTrue(config.ca_min <= parameter_set["ca"] <= config.ca_max)
+
+    def test_generate_random_parameters_with_seed(self):
+        """
+        Test that the same seed generates the same stellar parameters
+        """
+        config = Configuration("tests/test_input/configuration.cfg")
+        first = parameter_generation.generate_random_parameters(config, seed=42)
+        second = parameter_generation.generate_random_parameters(config, seed=42)
+        self.assertEqual(first, second)
+
     def test_validate_new_set_no_collision(self):
         new_set = (5300, 4.3, -0.7, 0.4, 0.5)
         result = parameter_generation._validate_new_set(
@@ -570,6 +632,27 @@ class TestParameterGeneration(unittest.TestCase):
             "The new set should be invalid due to collision with an existing set.",
         )
 
+    def test_validate_new_set_collision_with_teff_index(self):
+        new_set = (5003, 4.0, -1.0, 0.1, 0.2)
+        teff_index = {5000: [0], 5100: [1], 5200: [2]}
+        result = parameter_generation._validate_new_set(
+            *new_set, self.existing_parameters, teff_index
+        )
+        self.assertFalse(
+            result,
+            "The new set should be invalid due to collision with an existing set.",
+        )
+
+    def test_validate_new_set_no_collision_with_teff_index(self):
+        new_set = (5005, 4.0, -1.0, 0.1, 0.2)
+        teff_index = {5000: [0], 5100: [1], 5200: [2]}
+        result = parameter_generation._validate_new_set(
+            *new_set, self.existing_parameters, teff_index
+        )
+        self.assertTrue(
+            result, "The new set should be valid, teff is not within the minimum delta."
+        )
+
     def test_validate_new_set_partial_collision(self):
         new_set = (5000, 4.1, -1.0, 0.1, 0.2)
         result = parameter_generation._validate_new_set(
@@ -600,9 +683,7 @@ class TestParameterGeneration(unittest.TestCase):
             "The new set should be valid, no parameter within the minimum delta.",
         )
 
-    @patch("source.parameter_generation.random.randint")
-    @patch("source.parameter_generation.random.uniform")
-    def test_generate_random_parameters_no_conflicts(self, mock_randint, mock_uniform):
+    def test_generate_random_parameters_no_conflicts(self):
         """
         Test that the function successfully adds 10 randomly generated sets of stellar parameter when there are no conflicting parameter values
         Obs: This test is sensitive regarding the number of parameters to generate. If num_spectra in config is changed, the expected values must be updated, and the mock numbers
@@ -678,10 +759,14 @@ class TestParameterGeneration(unittest.TestCase):
             {"teff": 5045, "logg": 5.00, "z": 0.500, "mg": 0.55, "ca": 0.65},
         ]
         with patch(
-            "source.parameter_generation.random.randint", side_effect=randint_values
-        ), patch(
-            "source.parameter_generation.random.uniform", side_effect=uniform_values
-        ):
+            "source.parameter_generation.np.random.default_rng"
+        ) as mock_default_rng:
+            # Each column of candidates is drawn in one call, teff first and then logg, z, mg and ca
+            mock_rng = mock_default_rng.return_value
+            mock_rng.integers.return_value = np.array(randint_values)
+            mock_rng.uniform.side_effect = [
+                np.array(uniform_values[i::4]) for i in range(4)
+            ]
             result = parameter_generation.generate_random_parameters(config)
             self.assertEqual(len(result), 10)
             self.assertTrue(all(len(parameter_set) == 5 for parameter_set in result))
@@ -706,7 +791,20 @@ class TestParameterGeneration(unittest.TestCase):
         config.read_stellar_parameters_from_file = False
         config.random_parameters
         parameter_generation.generate_parameters(config)
-        mock_generate_random_parameters.assert_called_once_with(config)
+        mock_generate_random_parameters.assert_called_once_with(config, seed=None)
+
+    @patch("source.parameter_generation.generate_random_parameters")
+    def test_generate_parameters_random_with_seed(
+        self, mock_generate_random_parameters
+    ):
+        """
+        Test that the seed in the configuration is passed on to generate_random_parameters
+        """
+        config = Configuration("tests/test_input/configuration.cfg")
+        config.read_stellar_parameters_from_file = False
+        config.seed = 42
+        parameter_generation.generate_parameters(config)
+        mock_generate_random_parameters.assert_called_once_with(config, seed=42)
 
     def test_generate_evenly_spaced_parameters(self):
         config = Configuration("tests/test_input/configuration.cfg")
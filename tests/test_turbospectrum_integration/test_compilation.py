@@ -1,7 +1,7 @@
 import unittest
-from os import getcwd
-from subprocess import CalledProcessError
-from unittest.mock import MagicMock, call, patch
+from os import cpu_count, getcwd
+from subprocess import DEVNULL, PIPE, CalledProcessError
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 from source.configuration_setup import Configuration
@@ -22,9 +22,8 @@ class TestInterpolate(unittest.TestCase):
         # Set up a fresh Configuration object for each test
         self.config = Configuration()
 
-    @patch("source.turbospectrum_integration.compilation.chdir")
     @patch("source.turbospectrum_integration.compilation.run", autospec=True)
-    def test_compile_turboscpectrum_success(self, mock_run, mock_chdir):
+    def test_compile_turboscpectrum_success(self, mock_run):
         """Test that Turbospectrum compiles successfully."""
 
         # Mock subprocess.run to simulate a successful command
@@ -34,16 +33,16 @@ class TestInterpolate(unittest.TestCase):
 
         # Check if subprocess.run was called correclty
         mock_run.assert_called_once_with(
-            ["make"], check=True, text=True, capture_output=True
-        )
-        # Check if os.chdir was called correctly
-        mock_chdir.assert_has_calls(
-            [call(self.config.path_turbospectrum_compiled), call(getcwd())]
+            ["make", f"-j{cpu_count() or 1}"],
+            check=True,
+            text=True,
+            stdout=DEVNULL,
+            stderr=PIPE,
+            cwd=self.config.path_turbospectrum_compiled,
         )
 
-    @patch("source.turbospectrum_integration.compilation.chdir")
     @patch("source.turbospectrum_integration.compilation.run", autospec=True)
-    def test_compile_turbospectrum_failure(self, mock_run, mock_chdir):
+    def test_compile_turbospectrum_failure(self, mock_run):
         """Test that an error is raised if Turbospectrum compilation fails."""
 
         # Mock subprocess.run to simulate a failed command
@@ -52,29 +51,19 @@ class TestInterpolate(unittest.TestCase):
         with self.assertRaises(CalledProcessError):
             compilation.compile_turbospectrum(self.config)
 
-    @patch("source.turbospectrum_integration.compilation.chdir")
     @patch("source.turbospectrum_integration.compilation.run", autospec=True)
-    def test_return_to_original_directory_after_compile_turbospectrum(
-        self, mock_run, mock_chdir
-    ):
+    def test_working_directory_unchanged_after_compile_turbospectrum(self, mock_run):
         """
-        Test that the working directory is changed back to the original
-        directory after compiling Turbospectrum
+        Test that the working directory of the program is not changed by compiling Turbospectrum
         """
+        original_directory = getcwd()
 
-        original_directory = "/original/directory"
-        with patch(
-            "source.turbospectrum_integration.compilation.getcwd",
-            return_value=original_directory,
-        ):
-            compilation.compile_turbospectrum(self.config)
+        compilation.compile_turbospectrum(self.config)
 
-        # Make sure os.chdir is called to return to the original directory
-        mock_chdir.assert_called_with(original_directory)
+        self.assertEqual(getcwd(), original_directory)
 
-    @patch("source.turbospectrum_integration.compilation.chdir")
     @patch("source.turbospectrum_integration.compilation.run", autospec=True)
-    def test_compile_interpolator_success(self, mock_run, mock_chdir):
+    def test_compile_interpolator_success(self, mock_run):
         """Test that the interpolator is compiled successfully."""
         # Command to compile interpolator (copied from turbospectrum_integration/compilation.py)
         command = ["gfortran", "-o", "interpol_modeles", "interpol_modeles.f"]
@@ -86,12 +75,16 @@ class TestInterpolate(unittest.TestCase):
 
         # Check if subprocess.run was called correclty
         mock_run.assert_called_once_with(
-            command, check=True, text=True, capture_output=True
+            command,
+            check=True,
+            text=True,
+            stdout=DEVNULL,
+            stderr=PIPE,
+            cwd=self.config.path_interpolator,
         )
 
-    @patch("source.turbospectrum_integration.compilation.chdir")
     @patch("source.turbospectrum_integration.compilation.run", autospec=True)
-    def test_compile_interpolator_failure(self, mock_run, mock_chdir):
+    def test_compile_interpolator_failure(self, mock_run):
         """Test that an error is raised if the interpolator compilation fails."""
         # Command to compile interpolator (copied from turbospectrum_integration/compilation.py)
         command = ["gfortran", "-o", "interpol_modeles", "interpol_modeles.f"]
@@ -102,20 +95,13 @@ class TestInterpolate(unittest.TestCase):
         with self.assertRaises(CalledProcessError):
             compilation.compile_interpolator(self.config)
 
-    @patch("source.turbospectrum_integration.compilation.chdir")
     @patch("source.turbospectrum_integration.compilation.run", autospec=True)
-    def test_return_to_original_directory_after_compile_interpolator(
-        self, mock_run, mock_chdir
-    ):
+    def test_working_directory_unchanged_after_compile_interpolator(self, mock_run):
         """
-        Test that the working directory is changed back to the original directory after compiling the interpolator
+        Test that the working directory of the program is not changed by compiling the interpolator
         """
-        original_directory = "/original/directory"
-        with patch(
-            "source.turbospectrum_integration.compilation.getcwd",
-            return_value=original_directory,
-        ):
-            compilation.compile_interpolator(self.config)
+        original_directory = getcwd()
+
+        compilation.compile_interpolator(self.config)
 
-        # Make sure os.chdir is called to return to the original directory
-        mock_chdir.assert_called_with(original_directory)
+        self.assertEqual(getcwd(), original_directory)
@@ -5,6 +5,14 @@ import source.turbospectrum_integration.configuration as turbospectrum_config
 from source.configuration_setup import Configuration
 
 
+def _dir_entry(entry_path, is_file):
+    """Create a mock os.DirEntry with the given path and file type"""
+    entry = MagicMock()
+    entry.path = entry_path
+    entry.is_file.return_value = is_file
+    return entry
+
+
 class TestConfiguration(unittest.TestCase):
 
     def setUp(self):
@@ -46,6 +54,23 @@ class TestConfiguration(unittest.TestCase):
         self.assertEqual(ts_config.alpha, expected_alpha)
         self.assertEqual(ts_config.num_elements, 2)
 
+    def test_unknown_attribute_cannot_be_set(self):
+        """
+        Test that only the attributes declared in the slots can be set
+        """
+        stellar_parameters = {
+            "teff": 5210,
+            "logg": 4.3,
+            "z": 0.05,
+            "mg": 0.2,
+            "ca": 0.3,
+        }
+        ts_config = turbospectrum_config.TurbospectrumConfiguration(
+            Configuration(), stellar_parameters
+        )
+        with self.assertRaises(AttributeError):
+            ts_config.path_model_atmospere = "path/to/model"
+
     def test_calculate_alpha_lowest_value(self):
         """
         Test that the function returns 0.4 if the
@@ -194,12 +219,14 @@ class TestConfiguration(unittest.TestCase):
         # Check that the file was written with the correct content
         mock_open.assert_called_once_with(ts_config.path_babsma, "w")
 
-    @patch("source.turbospectrum_integration.configuration.path.isfile")
-    @patch("source.turbospectrum_integration.configuration.listdir")
-    def test_create_line_lists_string(self, mock_listdir, mock_isfile):
+    @patch("source.turbospectrum_integration.configuration.scandir")
+    def test_create_line_lists_string(self, mock_scandir):
         # Set up test data
-        mock_listdir.return_value = ["file1.txt", "file2.txt", "not_a_file"]
-        mock_isfile.side_effect = lambda filepath: filepath.endswith(".txt")
+        mock_scandir.return_value.__enter__.return_value = [
+            _dir_entry("/path/to/linelists/file1.txt", True),
+            _dir_entry("/path/to/linelists/file2.txt", True),
+            _dir_entry("/path/to/linelists/not_a_file", False),
+        ]
 
         # Create a mock Configuration object with the path_linelists attribute set to a string path
         config = MagicMock()
@@ -213,11 +240,31 @@ class TestConfiguration(unittest.TestCase):
         )
 
         # Call the function
+        turbospectrum_config._line_lists_str.cache_clear()
         result = turbospectrum_config.create_line_lists_str(config)
 
         # Check the result
         self.assertEqual(result, expected_line_lists_str)
 
+    @patch("source.turbospectrum_integration.configuration.scandir")
+    def test_create_line_lists_string_cached(self, mock_scandir):
+        """Test that the line list directory is only scanned once per path"""
+        mock_scandir.return_value.__enter__.return_value = [
+            _dir_entry("/path/to/linelists/file1.txt", True)
+        ]
+
+        config = MagicMock()
+        config.path_linelists = "/path/to/linelists"
+
+        # Call the function once per spectrum
+        turbospectrum_config._line_lists_str.cache_clear()
+        first = turbospectrum_config.create_line_lists_str(config)
+        second = turbospectrum_config.create_line_lists_str(config)
+
+        # Check that the directory was only read the first time
+        self.assertEqual(first, second)
+        mock_scandir.assert_called_once_with("/path/to/linelists")
+
     @patch("source.turbospectrum_integration.configuration.create_line_lists_str")
     @patch("builtins.open", new_callable=mock_open)
     def test_create_bsyn(
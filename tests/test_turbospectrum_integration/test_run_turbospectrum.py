@@ -1,5 +1,6 @@
 import unittest
-from subprocess import PIPE
+from concurrent.futures import ThreadPoolExecutor
+from subprocess import STDOUT
 from unittest.mock import MagicMock, mock_open, patch
 
 import pandas as pd
@@ -57,9 +58,8 @@ class TestRunTurbospectrum(unittest.TestCase):
         mock_run.assert_called_once_with(
             ["path/to/turbospectrum_compiled/babsma_lu"],
             stdin=mock_open(),
-            stdout=PIPE,
-            stderr=PIPE,
-            text=True,
+            stdout=mock_open(),
+            stderr=STDOUT,
         )
 
     @patch("builtins.open", new_callable=mock_open, read_data="mock data")
@@ -119,9 +119,8 @@ class TestRunTurbospectrum(unittest.TestCase):
         mock_run.assert_called_once_with(
             ["path/to/turbospectrum_compiled/bsyn_lu"],
             stdin=mock_open(),
-            stdout=PIPE,
-            stderr=PIPE,
-            text=True,
+            stdout=mock_open(),
+            stderr=STDOUT,
         )
 
     @patch("builtins.open", new_callable=mock_open, read_data="mock data")
@@ -311,6 +310,11 @@ class TestRunTurbospectrum(unittest.TestCase):
         # Verify the exception message
         self.assertEqual(str(context.exception), "More than one matching model found")
 
+    # Mocks can't be shared between processes, so the process pool is replaced by a thread pool
+    @patch(
+        "source.turbospectrum_integration.run_turbospectrum.ProcessPoolExecutor",
+        ThreadPoolExecutor,
+    )
     @patch("source.turbospectrum_integration.run_turbospectrum.generate_one_spectrum")
     def test_generate_all_spectr(self, mock_generate_one_spectrum):
         """
@@ -345,3 +349,26 @@ class TestRunTurbospectrum(unittest.TestCase):
 
         mock_generate_one_spectrum.assert_has_calls(expected_calls, any_order=True)
         self.assertEqual(mock_generate_one_spectrum.call_count, len(stellar_parameters))
+
+    @patch(
+        "source.turbospectrum_integration.run_turbospectrum.ProcessPoolExecutor",
+        ThreadPoolExecutor,
+    )
+    @patch("source.turbospectrum_integration.run_turbospectrum.generate_one_spectrum")
+    def test_generate_all_spectra_continues_after_error(
+        self, mock_generate_one_spectrum
+    ):
+        """
+        Test that an error for one set of stellar parameters does not stop the generation of the other spectra
+        """
+        config = MagicMock(spec=Configuration)
+        model_atmospheres = MagicMock(spec=pd.DataFrame)
+        stellar_parameters = (
+            {"teff": 5700, "logg": 4.5, "z": 0.0},
+            {"teff": 5800, "logg": 4.6, "z": 0.1},
+        )
+        mock_generate_one_spectrum.side_effect = [ValueError("mock error"), None]
+
+        generate_all_spectra(config, model_atmospheres, stellar_parameters)
+
+        self.assertEqual(mock_generate_one_spectrum.call_count, len(stellar_parameters))